@@ -27,6 +27,9 @@ from primo.utils.kpi_utils import calculate_average
 
 LOGGER = logging.getLogger(__name__)
 
+# Well data columns that contribute to the accessibility score of a project
+_ACCESSIBILITY_COLUMN_ATTR = ("elevation_delta", "dist_to_road")
+
 
 # pylint: disable=too-many-instance-attributes
 class Project:
@@ -77,10 +80,9 @@ class Project:
         # Optimization problem uses million USD. Convert it to USD
         self.plugging_cost = plugging_cost * 1e6
         self.efficiency_score = 0
-        accessibility_column_attr = ["elevation_delta", "dist_to_road"]
         self.accessibility_attr = [
             attribute
-            for attribute in accessibility_column_attr
+            for attribute in _ACCESSIBILITY_COLUMN_ATTR
             if hasattr(col_names, attribute)
         ]
 
@@ -108,14 +110,14 @@ class Project:
         """Returns number of wells that are near hospitals"""
         col_name = self._col_names.hospitals
         self._check_column_exists(col_name)
-        return len(self.well_data[self.well_data[col_name] > 0].index)
+        return int((self.well_data[col_name] > 0).sum())
 
     @property
     def num_wells_near_schools(self):
         """Returns number of wells that are near schools"""
         col_name = self._col_names.schools
         self._check_column_exists(col_name)
-        return len(self.well_data[self.well_data[col_name] > 0].index)
+        return int((self.well_data[col_name] > 0).sum())
 
     @property
     def average_age(self):
@@ -129,10 +131,8 @@ class Project:
         """
         Returns the range of the age of the project
         """
-        return (
-            self.well_data[self._col_names.age].max()
-            - self.well_data[self._col_names.age].min()
-        )
+        age = self.well_data[self._col_names.age]
+        return age.max() - age.min()
 
     @property
     def average_depth(self):
@@ -146,10 +146,8 @@ class Project:
         """
         Returns the range of the depth of the project
         """
-        return (
-            self.well_data[self._col_names.depth].max()
-            - self.well_data[self._col_names.depth].min()
-        )
+        depth = self.well_data[self._col_names.depth]
+        return depth.max() - depth.min()
 
     @property
     def elevation_delta(self):
@@ -222,7 +220,7 @@ class Project:
         """
         col_name = self._col_names.operator_name
         self._check_column_exists(col_name)
-        return len(set(self.well_data[col_name].values))
+        return self.well_data[col_name].nunique(dropna=False)
 
     @property
     def impact_score(self):
@@ -340,6 +338,13 @@ class Campaign:
         self.num_projects = len(self.projects)
         self.efficiency_calculator = EfficiencyCalculator(self)
 
+        # Inverse map from well id to project id. If a well appears in more than
+        # one project, the first project is retained.
+        self.well_to_project = {}
+        for project_id, project in self.projects.items():
+            for well_id in project.well_data.data[self.wd.column_names.well_id]:
+                self.well_to_project.setdefault(well_id, project_id)
+
     def get_project_id_by_well_id(self, well_id: str) -> Optional[int]:
         """
         Returns the project_id associated with the given well_id.
@@ -354,10 +359,7 @@ class Campaign:
         Optional[int]
             The project ID if the well exists in any project; otherwise, None.
         """
-        for project_id, project in self.projects.items():
-            if well_id in project.well_data.data[self.wd.column_names.well_id].values:
-                return project_id
-        return None
+        return self.well_to_project.get(well_id)
 
     def __str__(self) -> str:
         msg = (
@@ -418,7 +420,7 @@ class Campaign:
             name of the column containing the values of interest
 
         """
-        return max(self.wd[col_name].values)
+        return self.wd[col_name].max()
 
     def get_min_value_across_all_wells(self, col_name: str) -> Union[float, int]:
         """
@@ -429,7 +431,7 @@ class Campaign:
         col_name : str
             name of the column containing the values of interest
         """
-        return min(self.wd[col_name].values)
+        return self.wd[col_name].min()
 
     def plot_campaign(self, title: str):
         """
@@ -556,14 +558,12 @@ class Campaign:
                 project.efficiency_score for _, project in self.projects.items()
             ]
 
-            data = list(
-                zip(
-                    project_column,
-                    *attribute_data,
-                    accessibility_data,
-                    efficiency_scores,
-                )
-            )
+            columns = [
+                project_column,
+                *attribute_data,
+                accessibility_data,
+                efficiency_scores,
+            ]
             header.append(f"Accessibility Score [0-{total_weights[0]}]")
             header.append("Efficiency Score [0-100]")
         # if there is data for the accessibility score
@@ -572,30 +572,26 @@ class Campaign:
                 project.efficiency_score for _, project in self.projects.items()
             ]
             header.append("Efficiency Score [0-100]")
-            data = list(zip(project_column, *attribute_data, efficiency_scores))
+            columns = [project_column, *attribute_data, efficiency_scores]
 
-        return pd.DataFrame(data, columns=header)
+        # Build the frame column-wise; the values are already grouped by column
+        return pd.DataFrame(dict(zip(header, columns)))
 
     def get_campaign_summary(self):
         """
         Returns a pandas data frame of the project summary for demo printing
         """
-        rows = [
-            [
-                project.project_id,
-                project.num_wells,
-                project.impact_score,
-                project.efficiency_score,
-            ]
-            for _, project in self.projects.items()
-        ]
-        header = [
-            "Project ID",
-            "Number of Wells",
-            "Impact Score [0-100]",
-            "Efficiency Score [0-100]",
-        ]
-        return pd.DataFrame(rows, columns=header)
+        projects = self.projects.values()
+        return pd.DataFrame(
+            {
+                "Project ID": [project.project_id for project in projects],
+                "Number of Wells": [project.num_wells for project in projects],
+                "Impact Score [0-100]": [project.impact_score for project in projects],
+                "Efficiency Score [0-100]": [
+                    project.efficiency_score for project in projects
+                ],
+            }
+        )
 
     def export_data(
         self,
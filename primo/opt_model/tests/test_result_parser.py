@@ -386,6 +386,9 @@ def test_campaign_attributes(get_campaign):
         msg += "\n"
     assert str(campaign) == msg
     assert campaign.efficiency_calculator.efficiency_weights is None
+    assert campaign.well_to_project == {1: 2, 2: 2, 3: 3, 4: 3, 5: 4, 6: 4}
+    assert campaign.get_project_id_by_well_id(4) == 3
+    assert campaign.get_project_id_by_well_id(7) is None
 
 
 def test_get_max_value_across_all_projects(get_campaign):
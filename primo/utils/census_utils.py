@@ -24,8 +24,10 @@ from typing import List, Tuple, Union
 # Installed libs
 import censusgeocode as cg
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import requests
+import shapely
 from dotenv import load_dotenv
 
 # User-defined libs
@@ -167,7 +169,10 @@ def get_data_as_geodataframe(data) -> gpd.GeoDataFrame:
     wcn = data.column_names
     gdf = gpd.GeoDataFrame(
         data.data,
-        geometry=gpd.points_from_xy(data[wcn.longitude], data[wcn.latitude]),
+        geometry=shapely.points(
+            np.asarray(data[wcn.longitude], dtype=float),
+            np.asarray(data[wcn.latitude], dtype=float),
+        ),
         crs="EPSG:4326",
     )
     return gdf
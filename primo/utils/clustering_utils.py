@@ -87,7 +87,9 @@ def distance_matrix(
     data = wd.data if list_wells is None else wd.data.loc[list(list_wells)]
     cn = wd.column_names  # Column names
 
-    coordinates = list(zip(data[cn.latitude], data[cn.longitude]))
+    coordinates = np.column_stack(
+        (data[cn.latitude].to_numpy(float), data[cn.longitude].to_numpy(float))
+    )
     dist_matrix = wt_dist * (
         haversine_vector(coordinates, coordinates, unit=Unit.MILES, comb=True)
         if wt_dist > 0
@@ -13,12 +13,14 @@
 
 # Standard libs
 import logging
-from math import radians
-from typing import Any, List, Set, Tuple, Union
+from functools import lru_cache
+from math import asin, cos, radians, sin, sqrt
+from typing import Any, List, Optional, Set, Tuple, Union
 
 # Installed libs
 import folium
-from haversine import Unit, haversine
+import numpy as np
+from folium.plugins import MarkerCluster
 from sklearn.neighbors import BallTree
 
 # User-defined libs
@@ -26,6 +28,15 @@ from primo.utils.raise_exception import raise_exception
 
 LOGGER = logging.getLogger(__name__)
 
+# Mean radius of the earth in each supported distance unit
+_UNIT_RADIUS = {"MILES": 3958.7613, "KMS": 6371.0088}
+_VALID_UNITS = frozenset(_UNIT_RADIUS)
+_VALID_DISTANCE_TYPES = frozenset({"haversine"})
+
+# For fewer points than this, comparing all pairs directly is cheaper than
+# building a BallTree
+_BRUTE_FORCE_MAX_POINTS = 500
+
 
 def is_in_bounds(
     arg: Union[float, int],
@@ -113,7 +124,7 @@ def is_acceptable(
     if arg not in valid_args:
         if raise_except:
             msg = f"Value {arg} is not a valid argument for {arg_name}\n"
-            msg += f"Allowable values are: {','.join(valid_args)}"
+            msg += f"Allowable values are: {','.join(map(str, valid_args))}"
             raise_exception(msg, ValueError)
         return False
     return True
@@ -213,14 +224,14 @@ def get_distance(
 
     is_acceptable(
         arg=distance_type,
-        valid_args={"haversine"},
+        valid_args=_VALID_DISTANCE_TYPES,
         arg_name="distance_type",
         raise_except=True,
     )
 
     is_acceptable(
         arg=distance_unit,
-        valid_args={"MILES", "KMS"},
+        valid_args=_VALID_UNITS,
         arg_name="distance_unit",
         raise_except=True,
     )
@@ -228,12 +239,68 @@ def get_distance(
     is_valid_geopoint(origin)
     is_valid_geopoint(dest)
 
-    unit = Unit.MILES if distance_unit == "MILES" else Unit.KILOMETERS
-    return haversine(origin, dest, unit)
+    lat_1, long_1 = map(radians, origin)
+    lat_2, long_2 = map(radians, dest)
+    hav = (
+        sin((lat_2 - lat_1) / 2) ** 2
+        + cos(lat_1) * cos(lat_2) * sin((long_2 - long_1) / 2) ** 2
+    )
+    return 2 * _UNIT_RADIUS[distance_unit] * asin(sqrt(hav))
+
+
+def _count_within_cutoff(points_radians: np.ndarray, cutoff: float) -> np.ndarray:
+    """
+    Brute-force equivalent of querying a haversine BallTree with `count_only=True`
+    for every point, excluding the point itself.
+
+    Parameters
+    ----------
+    points_radians : np.ndarray
+        Array of shape (N, 2) with latitudes and longitudes in radians
+    cutoff : float
+        The radius used for the query on the haversine metric
+
+    Returns
+    -------
+    np.ndarray
+        Number of other points within the cutoff for each point
+    """
+    lat = points_radians[:, 0]
+    long = points_radians[:, 1]
+    hav = (
+        np.sin((lat[:, None] - lat[None, :]) / 2) ** 2
+        + np.cos(lat)[:, None]
+        * np.cos(lat)[None, :]
+        * np.sin((long[:, None] - long[None, :]) / 2) ** 2
+    )
+    distances = 2 * np.arcsin(np.sqrt(np.clip(hav, 0, 1)))
+    return np.count_nonzero(distances <= cutoff, axis=1) - 1
+
+
+@lru_cache(maxsize=8)
+def _build_ball_tree(points: Tuple[Tuple[float, float], ...]) -> BallTree:
+    """
+    Builds a haversine BallTree for points given in degrees. The tree is cached so
+    that repeated queries on the same points with different cutoffs reuse it.
+
+    Parameters
+    ----------
+    points : Tuple[Tuple[float, float], ...]
+        Points specified with their latitudes and longitudes
+
+    Returns
+    -------
+    BallTree
+        BallTree built on the points converted to radians
+    """
+    return BallTree(np.radians(np.array(points, dtype=float)), metric="haversine")
 
 
 def get_nearest_neighbors(
-    points: List[Tuple[float, float]], cutoff: float, distance_unit: str = "MILES"
+    points: List[Tuple[float, float]],
+    cutoff: float,
+    distance_unit: str = "MILES",
+    ball_tree: Optional[BallTree] = None,
 ) -> List[int]:
     """
     Given a list of points denoted by their latitudes and longitudes,
@@ -248,6 +315,9 @@ def get_nearest_neighbors(
         The distance to be used as a cutoff
     distance_unit : str, optional
         The unit for distance; one of `MILES` or `KMS`---by default "MILES"
+    ball_tree : Optional[BallTree], optional
+        A haversine BallTree built on `points` (in radians) to reuse across
+        queries; by default None, in which case a cached tree is used
 
     Returns
     -------
@@ -263,7 +333,7 @@ def get_nearest_neighbors(
 
     is_acceptable(
         arg=distance_unit,
-        valid_args={"MILES", "KMS"},
+        valid_args=_VALID_UNITS,
         arg_name="distance_unit",
         raise_except=True,
     )
@@ -274,18 +344,24 @@ def get_nearest_neighbors(
         is_valid_geopoint(point)
 
     # Convert latitudes and longitudes to radians
-    points_radians = [(radians(lat), radians(lon)) for lat, lon in points]
+    points_radians = np.radians(np.array(points, dtype=float).reshape(-1, 2))
+
+    # The haversine metric works on the unit sphere
+    cutoff_radians = cutoff / _UNIT_RADIUS[distance_unit]
 
-    # Build a BallTree for efficient nearest neighbor search
-    ball_tree = BallTree(points_radians, metric="haversine")
+    if ball_tree is None:
+        if len(points_radians) < _BRUTE_FORCE_MAX_POINTS:
+            return _count_within_cutoff(points_radians, cutoff_radians).tolist()
+
+        # Build a BallTree for efficient nearest neighbor search
+        ball_tree = _build_ball_tree(tuple(map(tuple, points)))
 
     # Query the BallTree to find neighbors within the specified cutoff
-    neighbors = [
-        len(ball_tree.query_radius([point], r=cutoff, count_only=True)[0]) - 1
-        for point in points_radians
-    ]
+    neighbors = (
+        ball_tree.query_radius(points_radians, r=cutoff_radians, count_only=True) - 1
+    )
 
-    return neighbors
+    return neighbors.tolist()
 
 
 def visualize_bing_maps_route(route, waypoints):
@@ -311,26 +387,24 @@ def visualize_bing_maps_route(route, waypoints):
 
     map_ = folium.Map(location=waypoints[0], zoom_start=10)
 
-    for i, waypoint in enumerate(waypoints):
-        folium.Marker(
-            location=waypoint, popup=f"Waypoint {i + 1}", icon=folium.Icon(color="blue")
-        ).add_to(map_)
-
-    total_distance = 0
-    total_duration = 0
-
-    for leg in route["routeLegs"]:
-        leg_distance = leg["travelDistance"]
-        leg_duration = leg["travelDuration"]
+    MarkerCluster(
+        locations=waypoints,
+        popups=[f"Waypoint {i + 1}" for i in range(len(waypoints))],
+    ).add_to(map_)
 
-        total_distance += leg_distance
-        total_duration += leg_duration
+    total_distance = sum(leg["travelDistance"] for leg in route["routeLegs"])
+    total_duration = sum(leg["travelDuration"] for leg in route["routeLegs"])
 
-        if "line" in leg:
-            route_path = leg["line"]["coordinates"]
-            folium.PolyLine(
-                locations=route_path, color="red", weight=2.5, opacity=1
-            ).add_to(map_)
+    route_path = [
+        coordinate
+        for leg in route["routeLegs"]
+        if "line" in leg
+        for coordinate in leg["line"]["coordinates"]
+    ]
+    if route_path:
+        folium.PolyLine(
+            locations=route_path, color="red", weight=2.5, opacity=1
+        ).add_to(map_)
 
     total_distance = round(total_distance, 3)
 
@@ -49,7 +49,7 @@ def _is_numeric_valid_column(
         raise_exception(msg, ValueError)
 
     if estimation_method == "no":
-        if any(pd.isnull(group[column_name])):
+        if group[column_name].isna().any():
             msg = f"Empty values were detected for column: {column_name}."
             raise_exception(msg, ValueError)
 
@@ -154,11 +154,56 @@ def calculate_number_of_owners(group: pd.DataFrame) -> int:
         The number of unique owners within the group
     """
 
-    if any(group["Operator Name"].eq("")):
+    if group["Operator Name"].eq("").any():
         msg = "Empty values were detected for column: Operator Name."
         raise_exception(msg, ValueError)
 
-    return len(set(group["Operator Name"]))
+    return group["Operator Name"].nunique(dropna=False)
+
+
+class _SortedGroups:
+    """
+    Stores the wells of a DataFrame sorted by project, so that per-project
+    statistics can be computed with a single NumPy reduction per column.
+
+    Parameters
+    ----------
+    merged_df : pd.DataFrame
+        The merged DataFrame containing project data
+    """
+
+    def __init__(self, merged_df: pd.DataFrame):
+        self._df = merged_df
+        codes, self.projects = pd.factorize(merged_df["Project"], sort=True)
+        # Wells without a project are ignored, as with DataFrame.groupby
+        self._valid = codes >= 0
+        self._order = np.argsort(codes[self._valid], kind="stable")
+        sorted_codes = codes[self._valid][self._order]
+        self.starts = np.searchsorted(sorted_codes, np.arange(len(self.projects)))
+        self.sizes = np.diff(np.append(self.starts, sorted_codes.size))
+
+    def column(self, column_name: str, dtype=None) -> np.ndarray:
+        """Returns the values of a column ordered by project"""
+        return self._df[column_name].to_numpy(dtype=dtype)[self._valid][self._order]
+
+    def average(self, column_name: str) -> pd.Series:
+        """Equivalent of calculate_average applied to every project"""
+        values = np.abs(self.column(column_name, dtype=float))
+        is_valid = ~np.isnan(values)
+        totals = np.add.reduceat(np.where(is_valid, values, 0.0), self.starts)
+        counts = np.add.reduceat(is_valid, self.starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(counts > 0, totals / counts, np.nan)
+        return pd.Series(means, index=self.projects)
+
+    def range(self, column_name: str) -> pd.Series:
+        """Equivalent of calculate_range applied to every project"""
+        values = self.column(column_name)
+        return pd.Series(
+            np.maximum.reduceat(values, self.starts)
+            - np.minimum.reduceat(values, self.starts),
+            index=self.projects,
+        )
 
 
 # pylint: disable=too-many-locals
@@ -178,118 +223,58 @@ def process_data(merged_df: pd.DataFrame, centroids: dict) -> pd.DataFrame:
     pd.DataFrame
         A DataFrame containing computed statistics for each project
     """
-    cluster_groups = merged_df.groupby("Project")
-
-    average_age = cluster_groups.apply(
-        calculate_average, column_name="Age [Years]", include_groups=False
-    )
-
-    average_age_df = pd.DataFrame(
-        {"Project": average_age.index, "Average Age [Years]": average_age.values}
-    )
-
-    average_depth = cluster_groups.apply(
-        calculate_average, column_name="Depth [ft]", include_groups=False
-    )
-    average_depth_df = pd.DataFrame(
-        {"Project": average_depth.index, "Average Depth [ft]": average_depth.values}
-    )
-
-    age_ranges = cluster_groups.apply(
-        calculate_range, column_name="Age [Years]", include_groups=False
-    )
-    age_ranges_df = pd.DataFrame(
-        {"Project": age_ranges.index, "Age Range [Years]": age_ranges.values}
-    )
-
-    depth_ranges = cluster_groups.apply(
-        calculate_range, column_name="Depth [ft]", include_groups=False
-    )
-    depth_ranges_df = pd.DataFrame(
-        {"Project": depth_ranges.index, "Depth Range [ft]": depth_ranges.values}
-    )
-
-    well_number = cluster_groups.apply(calculate_well_number, include_groups=False)
-    well_number_df = pd.DataFrame(
-        {
-            "Project": well_number.index,
-            "Average Well Score": well_number.values,
-        }
-    )
-
-    elevation_average = cluster_groups.apply(
-        calculate_average,
-        column_name="Elevation Delta [m]",
-        estimation_method="yes",
-        include_groups=False,
-    )
-    elevation_average_df = pd.DataFrame(
-        {
-            "Project": elevation_average.index,
-            "Average Elevation Delta [m]": elevation_average.values,
-        }
-    )
-
-    road_distance_average = cluster_groups.apply(
-        calculate_average, column_name="Distance to Road [miles]", include_groups=False
-    )
-    road_distance_average_df = pd.DataFrame(
-        {
-            "Project": road_distance_average.index,
-            "Average Distance to Road [miles]": road_distance_average.values,
-        }
-    )
-
-    centroid_distance_average = cluster_groups.apply(
-        calculate_average,
-        column_name="Distance to Centroid [miles]",
-        include_groups=False,
-    )
-    centroid_distance_average_df = pd.DataFrame(
-        {
-            "Project": centroid_distance_average.index,
-            "Distance to Centroid [miles]": centroid_distance_average.values,
-        }
-    )
-
-    number_of_owners = cluster_groups.apply(
-        calculate_number_of_owners, include_groups=False
-    )
-    number_of_owners_df = pd.DataFrame(
-        {"Project": number_of_owners.index, "Operator Name": number_of_owners.values}
-    )
+    # Column checks do not depend on the group, so run them once on the full data
+    for column_name, estimation_method in [
+        ("Age [Years]", "no"),
+        ("Depth [ft]", "no"),
+        ("Elevation Delta [m]", "yes"),
+        ("Distance to Road [miles]", "no"),
+        ("Distance to Centroid [miles]", "no"),
+        ("Priority Score [0-100]", "no"),
+    ]:
+        _is_numeric_valid_column(merged_df, column_name, estimation_method)
+
+    if merged_df["Operator Name"].eq("").any():
+        msg = "Empty values were detected for column: Operator Name."
+        raise_exception(msg, ValueError)
 
-    average_priority_score = cluster_groups.apply(
-        calculate_average, column_name="Priority Score [0-100]", include_groups=False
-    )
-    average_priority_score_df = pd.DataFrame(
-        {
-            "Project": average_priority_score.index,
-            "Average Priority Score [0-100]": average_priority_score.values,
-        }
+    groups = _SortedGroups(merged_df)
+    project_order = list(centroids.keys())
+    average_age = groups.average("Age [Years]")
+    average_depth = groups.average("Depth [ft]")
+    age_ranges = groups.range("Age [Years]")
+    depth_ranges = groups.range("Depth [ft]")
+    well_number = pd.Series(groups.sizes, index=groups.projects)
+    elevation_average = groups.average("Elevation Delta [m]")
+    road_distance_average = groups.average("Distance to Road [miles]")
+    centroid_distance_average = groups.average("Distance to Centroid [miles]")
+    number_of_owners = merged_df.groupby("Project")["Operator Name"].nunique(
+        dropna=False
     )
+    average_priority_score = groups.average("Priority Score [0-100]")
 
+    # Align every per-project statistic with the order of the centroids
     new_data = {
-        "Project": list(centroids.keys()),
+        "Project": project_order,
         "Project Centroid": list(centroids.values()),
-        "Number of Wells": well_number_df["Average Well Score"].tolist(),
-        "Number of Unique Owners": number_of_owners_df["Operator Name"].tolist(),
-        "Average Elevation Delta [m]": elevation_average_df[
-            "Average Elevation Delta [m]"
-        ].tolist(),
-        "Average Distance to Road [miles]": road_distance_average_df[
-            "Average Distance to Road [miles]"
-        ].tolist(),
-        "Distance to Centroid [miles]": centroid_distance_average_df[
-            "Distance to Centroid [miles]"
-        ].tolist(),
-        "Age Range [Years]": age_ranges_df["Age Range [Years]"].tolist(),
-        "Average Age [Years]": average_age_df["Average Age [Years]"].tolist(),
-        "Depth Range [ft]": depth_ranges_df["Depth Range [ft]"].tolist(),
-        "Average Depth [ft]": average_depth_df["Average Depth [ft]"].tolist(),
-        "Impact Score [0-100]": average_priority_score_df[
-            "Average Priority Score [0-100]"
-        ].tolist(),
+        "Number of Wells": well_number.reindex(project_order).to_numpy(),
+        "Number of Unique Owners": number_of_owners.reindex(project_order).to_numpy(),
+        "Average Elevation Delta [m]": elevation_average.reindex(
+            project_order
+        ).to_numpy(),
+        "Average Distance to Road [miles]": road_distance_average.reindex(
+            project_order
+        ).to_numpy(),
+        "Distance to Centroid [miles]": centroid_distance_average.reindex(
+            project_order
+        ).to_numpy(),
+        "Age Range [Years]": age_ranges.reindex(project_order).to_numpy(),
+        "Average Age [Years]": average_age.reindex(project_order).to_numpy(),
+        "Depth Range [ft]": depth_ranges.reindex(project_order).to_numpy(),
+        "Average Depth [ft]": average_depth.reindex(project_order).to_numpy(),
+        "Impact Score [0-100]": average_priority_score.reindex(
+            project_order
+        ).to_numpy(),
     }
 
     new_df = pd.DataFrame(new_data)
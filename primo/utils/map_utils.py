@@ -12,13 +12,19 @@
 #################################################################################
 
 # Standard libs
+import hashlib
 import os
-from typing import Dict
+import tempfile
+from functools import lru_cache
+from itertools import cycle
+from typing import Dict, Optional, Sequence, Tuple
 
 # Installed libs
 import folium
 import geopandas as gpd
-from folium.plugins import BeautifyIcon
+import numpy as np
+import shapely
+from folium.plugins import FastMarkerCluster
 
 # User-defined libs
 from primo.data_parser.well_data import WellData
@@ -27,30 +33,197 @@ from primo.utils.census_utils import get_data_as_geodataframe
 from primo.utils.download_utils import download_file, unzip_file
 from primo.utils.raise_exception import raise_exception
 
+# Colors assigned to clusters, in order
+_CLUSTER_COLORS = (
+    "red",
+    "blue",
+    "green",
+    "orange",
+    "purple",
+    "yellow",
+    "cyan",
+    "magenta",
+    "pink",
+    "brown",
+    "black",
+)
+
+# Above this number of wells, markers are clustered in the browser by default
+_CLUSTER_MIN_WELLS = 1000
+
+# Environment variable overriding the directory where shapefiles are stored
+_CACHE_DIR_ENV_VAR = "PRIMO_CACHE_DIR"
+
+# Blue cross drawn with the font-awesome "times" glyph, used for oil wells
+_OIL_ICON_HTML = '<i class="fa fa-times" style="color:blue;font-size:18px;"></i>'
+
+# JavaScript expressions creating the marker of a FastMarkerCluster row
+_OIL_MARKER_JS = (
+    "L.marker(new L.LatLng(row[0], row[1]), {icon: L.divIcon("
+    f"{{html: '{_OIL_ICON_HTML}', className: 'empty'}})}})"
+)
+_CIRCLE_MARKER_JS = (
+    "L.circleMarker(new L.LatLng(row[0], row[1]), {{radius: 5, "
+    "fill: true, color: '{color}', fillColor: '{color}'}})"
+)
+
 
 def get_cluster_colors(cluster_list: list) -> Dict[int, str]:
     """Generate a color scheme for clusters."""
-    colors = [
-        "red",
-        "blue",
-        "green",
-        "orange",
-        "purple",
-        "yellow",
-        "cyan",
-        "magenta",
-        "pink",
-        "brown",
-        "black",
+    return dict(zip(cluster_list, cycle(_CLUSTER_COLORS)))
+
+
+def get_cluster_color_array(cluster_index: Sequence[int]) -> np.ndarray:
+    """
+    Vectorized counterpart of get_cluster_colors: returns the color of each
+    cluster given its position in the list of clusters.
+
+    Parameters
+    ----------
+    cluster_index : Sequence[int]
+        Position of each cluster in the list of clusters
+
+    Returns
+    -------
+    np.ndarray
+        Array with the color of each entry of `cluster_index`
+    """
+    return np.take(
+        _CLUSTER_COLORS, np.asarray(cluster_index, dtype=int) % len(_CLUSTER_COLORS)
+    )
+
+
+def _get_point_features(
+    lats: Sequence[float], lons: Sequence[float], **properties: Sequence
+) -> dict:
+    """
+    Builds a GeoJSON FeatureCollection of points, so that a set of markers can be
+    added to a folium map as a single layer.
+
+    Parameters
+    ----------
+    lats : Sequence[float]
+        Latitudes of the points
+
+    lons : Sequence[float]
+        Longitudes of the points
+
+    **properties : Sequence
+        Values of each feature property, given in the same order as the points
+
+    Returns
+    -------
+    dict
+        GeoJSON FeatureCollection with one Point feature per location
+    """
+    names = list(properties)
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [float(lon), float(lat)]},
+            "properties": dict(zip(names, values)),
+        }
+        for lat, lon, *values in zip(lats, lons, *properties.values())
     ]
-    return {cluster_list[i]: colors[i % len(colors)] for i in range(len(cluster_list))}
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _get_cache_dir() -> str:
+    """
+    Returns the directory where downloaded shapefiles are stored, creating it if
+    needed. It is given by the PRIMO_CACHE_DIR environment variable, and defaults
+    to a directory in the temporary directory of the system.
+
+    Returns
+    -------
+    str
+        Path to the cache directory
+    """
+    cache_dir = os.environ.get(_CACHE_DIR_ENV_VAR) or os.path.join(
+        tempfile.gettempdir(), "primo_shapefiles"
+    )
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
 
+@lru_cache(maxsize=8)
+def _load_state_shapefile(
+    shpfile_name: str, shpfile_url: str, shp_name: str
+) -> gpd.GeoDataFrame:
+    """
+    Download, unzip, and load a state shapefile into a GeoDataFrame. Files are
+    stored in the directory returned by _get_cache_dir and reused when already on
+    disk, including the reprojected GeoDataFrame. The result is also cached for
+    the lifetime of the process so that it is shared by all VisualizeData
+    instances.
+
+    Parameters
+    ----------
+    shpfile_name : str
+        Name of the shapefile archive.
+
+    shpfile_url : str
+        URL of the shapefile archive.
+
+    shp_name : str
+        Name of the extracted shapefile.
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        GeoDataFrame of the state shapefile.
+    """
+    scratch_dir = _get_cache_dir()
 
+    # Reprojected shapefiles are saved in Feather format, so that later runs skip
+    # the download, the parsing of the shapefile and the reprojection
+    cache_key = hashlib.sha1(f"{shpfile_url}|{shp_name}".encode()).hexdigest()
+    cache_file = os.path.join(scratch_dir, f"{cache_key}.feather")
+    if os.path.exists(cache_file):
+        return gpd.read_feather(cache_file)
+
+    extract_dir = os.path.join(scratch_dir, shp_name)
+    if not os.path.exists(os.path.join(extract_dir, shp_name)):
+        shapefile = os.path.join(scratch_dir, shpfile_name)
+        download_file(shapefile, shpfile_url)
+        unzip_file(shapefile, extract_dir)
+
+    try:
+        # Read columns in bulk through Arrow instead of feature by feature
+        state_shapefile = gpd.read_file(
+            os.path.join(extract_dir, shp_name), engine="pyogrio", use_arrow=True
+        )
+    except ImportError:
+        state_shapefile = gpd.read_file(os.path.join(extract_dir, shp_name))
+    state_shapefile = state_shapefile.to_crs("EPSG:4269")
+    state_shapefile.to_feather(cache_file)
+    return state_shapefile
+
+
+# pylint: disable=too-many-instance-attributes
 class VisualizeData:
     """
     Class to visualize well data using folium and geopandas.
     """
 
+    # Legend and title drawn on top of the maps
+    _LEGEND_HTML = """
+    <div style="position: fixed;
+                top: 10px; right: 10px; width: 120px; height: 80px;
+                border:2px solid grey; z-index:9999; font-size:14px;
+                background-color: white;">
+    <center><br><i style="color:red">o - Gas Well</i><br>
+    <i style="color:blue">x - Oil Well</i><br></center>
+    </div>
+    """
+    _TITLE_HTML = '<h1 style="position:absolute;z-index:100000;left:35vw" >{title}</h1>'
+
+    # Label placed on each county of the state shapefile
+    _COUNTY_LABEL_HTML = (
+        '<div style="font-size: 11pt; color: black; text-align: center; '
+        'font-weight: bold;">{name}</div>'
+    )
+
     def __init__(
         self,
         well_data: WellData,
@@ -81,13 +254,36 @@ class VisualizeData:
         self.state_shapefile_name = state_shapefile_name
         self.shp_name = shp_name
         self.state_shapefile = None
+        self._county_labels = None
+        self._map_center = None
+        self._shapefile_geojson = {}
         self.df = get_data_as_geodataframe(self.well_data)
 
+        # Wells without a valid location cannot be placed on the map, so they are
+        # dropped once here rather than checked for each marker
+        geometry = self.df.geometry.to_numpy()
+        located = np.flatnonzero(
+            ~(shapely.is_missing(geometry) | shapely.is_empty(geometry))
+        )
+        coordinates = shapely.get_coordinates(geometry[located])
+        finite = np.isfinite(coordinates).all(axis=1)
+        located = located[finite]
+        coordinates = coordinates[finite]
+
+        # Well attributes used for markers, stored as one array per attribute
+        self._well_ids = self.df[self.well_data.col_names.well_id].to_numpy()[located]
+        self._ages = self.df[self.well_data.col_names.age].to_numpy()[located]
+        self._depths = self.df[self.well_data.col_names.depth].to_numpy()[located]
+        self._lats = coordinates[:, 1]
+        self._lons = coordinates[:, 0]
+        self._well_popups = None
+
     def _get_state_shapefile(
         self, shpfile_name: str, shpfile_url: str, shp_name: str
     ) -> gpd.GeoDataFrame:
         """
         Download, unzip, and load the state shapefile into a GeoDataFrame.
+        The shapefile is loaded once per process, and a copy is returned.
 
         Parameters
         ----------
@@ -105,24 +301,83 @@ class VisualizeData:
         gpd.GeoDataFrame
             GeoDataFrame of the state shapefile.
         """
+        return _load_state_shapefile(shpfile_name, shpfile_url, shp_name).copy()
 
-        scratch_dir = os.path.join(os.getcwd(), "temp")
-        if not os.path.exists(scratch_dir):
-            os.mkdir(scratch_dir)
+    def _get_county_labels(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the county names in the state shapefile along with the latitude
+        and longitude of a point inside each county, where its label is placed.
+        The result is cached on the instance.
 
-        shapefile = os.path.join(scratch_dir, shpfile_name)
-        download_file(shapefile, shpfile_url)
-        extract_dir = os.path.join(scratch_dir, shp_name)
-        unzip_file(shapefile, extract_dir)
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            County names, label latitudes and label longitudes
 
-        state_shapefile = gpd.read_file(os.path.join(extract_dir, shp_name))
-        return state_shapefile.to_crs("EPSG:4269")
+        Raises
+        ------
+        AttributeError
+            If none of the known county name columns are in the shapefile
+        """
+        if self._county_labels is None:
+            name_col = next(
+                (
+                    col
+                    for col in ["NAME", "County_Nam", "COUNTY_NAM", "COUNTY"]
+                    if col in self.state_shapefile.columns
+                ),
+                None,
+            )
+            if name_col is None:
+                raise_exception(
+                    "None of the county name attributes are found.", AttributeError
+                )
+
+            # Unlike centroids, these points always lie on the county polygon
+            # and are well defined in geographic coordinates
+            points = shapely.get_coordinates(
+                shapely.point_on_surface(np.asarray(self.state_shapefile.geometry))
+            )
+            self._county_labels = (
+                self.state_shapefile[name_col].to_numpy(),
+                points[:, 1],
+                points[:, 0],
+            )
+        return self._county_labels
+
+    def _get_shapefile_geojson(self, tolerance: float) -> str:
+        """
+        Returns the county polygons of the state shapefile as a GeoJSON string,
+        simplified to the given tolerance. The string is cached on the instance
+        for each tolerance.
+
+        Parameters
+        ----------
+        tolerance : float
+            Maximum distance, in degrees, between the original and the simplified
+            county borders. No simplification is done if it is not positive
+
+        Returns
+        -------
+        str
+            GeoJSON representation of the state shapefile
+        """
+        if tolerance not in self._shapefile_geojson:
+            simplified = self.state_shapefile
+            if tolerance > 0:
+                simplified = simplified.copy()
+                simplified.geometry = simplified.geometry.simplify(
+                    tolerance, preserve_topology=True
+                )
+            self._shapefile_geojson[tolerance] = simplified.to_json()
+        return self._shapefile_geojson[tolerance]
 
     def _create_map_with_legend(
         self,
         legend=False,
         map_title: str = None,
         shapefile=True,
+        simplify_tolerance: float = 0.001,
     ) -> folium.Map:
         """
         Create a folium map centered around the region with an optional legend and map title.
@@ -138,6 +393,10 @@ class VisualizeData:
         shapefile: bool, optional
             Whether to include a shapefile on the map or not. Default is True
 
+        simplify_tolerance : float, optional
+            Tolerance, in degrees, used to simplify county borders before they are
+            added to the map. Default is 0.001
+
         Returns
         -------
         folium.Map
@@ -148,21 +407,17 @@ class VisualizeData:
                 self.state_shapefile_name, self.state_shapefile_url, self.shp_name
             )
 
-        if self.state_shapefile is not None:
-            if (
-                self.state_shapefile.crs is None
-                or not self.state_shapefile.crs.is_projected
-            ):
-                centroid = self.state_shapefile.to_crs("+proj=cea").centroid.to_crs(
-                    self.state_shapefile.crs
+        if self.state_shapefile is not None and self._map_center is None:
+            # Center the map on the bounding box of the state
+            bounds = self.state_shapefile.total_bounds
+            if np.isfinite(bounds).all():
+                self._map_center = (
+                    (bounds[1] + bounds[3]) / 2,
+                    (bounds[0] + bounds[2]) / 2,
                 )
-            else:
-                centroid = self.state_shapefile.centroid
-        else:
-            centroid = None
 
-        if centroid is not None:
-            map_center = (centroid.y.mean(), centroid.x.mean())
+        if self.state_shapefile is not None and self._map_center is not None:
+            map_center = self._map_center
         else:
             first_well = self.well_data.data.iloc[0]
             map_center = (
@@ -170,53 +425,32 @@ class VisualizeData:
                 first_well[self.well_data.col_names.longitude],
             )
 
-        map_obj = folium.Map(location=map_center, zoom_start=8.2)
+        # Vector layers are drawn on a canvas, which scales to many more markers
+        # than individual SVG elements
+        map_obj = folium.Map(location=map_center, zoom_start=8.2, prefer_canvas=True)
 
         if shapefile and self.state_shapefile is not None:
-            folium.GeoJson(self.state_shapefile).add_to(map_obj)
-
-            # Add county names as markers
-            for county in self.state_shapefile.itertuples():
-                county_name = (
-                    getattr(county, "NAME", None)
-                    or getattr(county, "County_Nam", None)
-                    or getattr(county, "COUNTY_NAM", None)
-                    or getattr(county, "COUNTY", None)
-                )
-
-                if county_name is None:
-                    raise_exception(
-                        "None of the county name attributes are found.", AttributeError
-                    )
+            folium.GeoJson(self._get_shapefile_geojson(simplify_tolerance)).add_to(
+                map_obj
+            )
 
-                centroid = [county.geometry.centroid.y, county.geometry.centroid.x]
+            # Add county names as markers, grouped in a single layer of the map
+            county_names = folium.FeatureGroup(name="County names")
+            for county_name, lat, lon in zip(*self._get_county_labels()):
                 folium.map.Marker(
-                    location=centroid,
+                    location=[lat, lon],
                     icon=folium.DivIcon(
-                        html=(
-                            f'<div style="font-size: 11pt; color: black; text-align: center; '
-                            f'font-weight: bold;">{county_name}</div>'
-                        )
+                        html=self._COUNTY_LABEL_HTML.format(name=county_name)
                     ),
-                ).add_to(map_obj)
-
-        # Create legend
-        if legend is True:
-            gas_legend = '<i style="color:red">o - Gas Well</i>'
-            oil_legend = '<i style="color:blue">x - Oil Well</i>'
-            legend_html = f"""
-            <div style="position: fixed;
-                        top: 10px; right: 10px; width: 120px; height: 80px;
-                        border:2px solid grey; z-index:9999; font-size:14px;
-                        background-color: white;">
-            <center><br>{gas_legend}<br>{oil_legend}<br></center>
-            </div>
-            """
-            map_obj.get_root().html.add_child(folium.Element(legend_html))
-
-        if map_title is not None:
-            title_html = f'<h1 style="position:absolute;z-index:100000;left:35vw" >{map_title}</h1>'
-            map_obj.get_root().html.add_child(folium.Element(title_html))
+                ).add_to(county_names)
+            county_names.add_to(map_obj)
+
+        # Add legend and title as a single element
+        overlay_html = (self._LEGEND_HTML if legend is True else "") + (
+            self._TITLE_HTML.format(title=map_title) if map_title is not None else ""
+        )
+        if overlay_html:
+            map_obj.get_root().html.add_child(folium.Element(overlay_html))
 
         return map_obj
 
@@ -224,6 +458,7 @@ class VisualizeData:
         self,
         map_obj: folium.Map,
         well_type_to_plot: str = None,
+        cluster: Optional[bool] = None,
     ) -> None:
         """
         Add markers to a folium map based on the visualization type and well type.
@@ -236,48 +471,71 @@ class VisualizeData:
         well_type_to_plot : str, optional
             Type of well to plot ('Gas' or 'Oil'). Default is None.
 
+        cluster : Optional[bool], optional
+            Whether to group nearby markers into clusters rendered in the browser.
+            Default is None, in which case markers are clustered only for large
+            sets of wells.
+
         Raises
         ------
         ValueError
             If visualize_type is 'project' but campaign is not provided.
         """
 
-        for row in self.df.itertuples():
-            well_id = row[self.df.columns.get_loc(self.well_data.col_names.well_id) + 1]
-            age = row[self.df.columns.get_loc(self.well_data.col_names.age) + 1]
-            depth = row[self.df.columns.get_loc(self.well_data.col_names.depth) + 1]
-
-            popup_text = f"Well ID: {well_id}<br>Age: {age}<br>Depth: {depth}"
-
-            if well_type_to_plot == "Gas":
-                folium.CircleMarker(
-                    location=[row.geometry.y, row.geometry.x],
-                    radius=5,
-                    popup=popup_text,
-                    fill=True,
-                    color="red",
-                ).add_to(map_obj)
-            elif well_type_to_plot == "Oil":
-                icon_cross = BeautifyIcon(
-                    icon="times",
-                    inner_icon_style="color:blue;font-size:18px;",
-                    background_color="transparent",
-                    border_color="transparent",
-                )
-                folium.Marker(
-                    location=[row.geometry.y, row.geometry.x],
-                    popup=popup_text,
-                    icon=icon_cross,
-                ).add_to(map_obj)
+        # Popups do not depend on the well type, so build them once per instance
+        # with vectorized string concatenation
+        if self._well_popups is None:
+            popups = np.char.add("Well ID: ", self._well_ids.astype(str))
+            popups = np.char.add(popups, "<br>Age: ")
+            popups = np.char.add(popups, self._ages.astype(str))
+            popups = np.char.add(popups, "<br>Depth: ")
+            self._well_popups = np.char.add(popups, self._depths.astype(str)).tolist()
+        popups = self._well_popups
+        if not popups:
+            return
+
+        # Default marker style for other well types is green
+        color = "red" if well_type_to_plot == "Gas" else "green"
+
+        if cluster is None:
+            cluster = len(popups) > _CLUSTER_MIN_WELLS
+
+        if cluster:
+            if well_type_to_plot == "Oil":
+                marker_js = _OIL_MARKER_JS
             else:
-                # Default marker style for other well types
-                folium.CircleMarker(
-                    location=[row.geometry.y, row.geometry.x],
-                    radius=5,
-                    popup=popup_text,
-                    fill=True,
-                    color="green",
-                ).add_to(map_obj)
+                marker_js = _CIRCLE_MARKER_JS.format(color=color)
+            FastMarkerCluster(
+                [
+                    [lat, lon, popup]
+                    for lat, lon, popup in zip(
+                        self._lats.tolist(), self._lons.tolist(), popups
+                    )
+                ],
+                callback=(
+                    f"function (row) {{var marker = {marker_js}; "
+                    "marker.bindPopup(row[2]); return marker;}"
+                ),
+            ).add_to(map_obj)
+            return
+
+        well_features = _get_point_features(self._lats, self._lons, popup=popups)
+        if well_type_to_plot == "Oil":
+            folium.GeoJson(
+                well_features,
+                marker=folium.Marker(
+                    icon=folium.DivIcon(html=_OIL_ICON_HTML, class_name="empty")
+                ),
+                popup=folium.GeoJsonPopup(fields=["popup"], labels=False),
+            ).add_to(map_obj)
+            return
+
+        folium.GeoJson(
+            well_features,
+            marker=folium.CircleMarker(radius=5, fill=True),
+            style_function=lambda _: {"color": color, "fillColor": color},
+            popup=folium.GeoJsonPopup(fields=["popup"], labels=False),
+        ).add_to(map_obj)
 
     def _add_campaign_markers(
         self,
@@ -306,28 +564,37 @@ class VisualizeData:
             raise ValueError(
                 "A Campaign instance must be provided when visualize_type is 'project'."
             )
-        project_ids = set()  # Use a set to avoid duplicates
-        for row in self.df.itertuples():
-            well_id = row[self.df.columns.get_loc(self.well_data.col_names.well_id) + 1]
-            project_id = campaign.get_project_id_by_well_id(well_id)
-            if project_id is not None:
-                project_ids.add(project_id)
-
-        project_colors = get_cluster_colors(list(project_ids))
-
-        for row in self.df.itertuples():
-            well_id = row[self.df.columns.get_loc(self.well_data.col_names.well_id) + 1]
-            project_id = campaign.get_project_id_by_well_id(well_id)
-
-            if project_id is not None:
-                popup_text = f"Candidate Project: Project {project_id}"
-                folium.CircleMarker(
-                    location=[row.geometry.y, row.geometry.x],
-                    radius=5,
-                    popup=popup_text,
-                    fill=True,
-                    color=project_colors.get(project_id, "gray"),
-                ).add_to(map_obj)
+        well_projects = [campaign.well_to_project.get(w) for w in self._well_ids]
+        in_project = np.array([p is not None for p in well_projects], dtype=bool)
+
+        # Map each well to the position of its project among the unique projects,
+        # so that popups are built once per project
+        project_ids, project_index = np.unique(
+            [p for p in well_projects if p is not None], return_inverse=True
+        )
+        popups = np.array(
+            [f"Candidate Project: Project {p}" for p in project_ids.tolist()],
+            dtype=object,
+        )
+
+        project_features = _get_point_features(
+            self._lats[in_project],
+            self._lons[in_project],
+            popup=popups[project_index],
+            color=get_cluster_color_array(project_index),
+        )
+        if not project_features["features"]:
+            return
+
+        folium.GeoJson(
+            project_features,
+            marker=folium.CircleMarker(radius=5, fill=True),
+            style_function=lambda feature: {
+                "color": feature["properties"]["color"],
+                "fillColor": feature["properties"]["color"],
+            },
+            popup=folium.GeoJsonPopup(fields=["popup"], labels=False),
+        ).add_to(map_obj)
 
     def visualize_wells(
         self,
@@ -335,6 +602,7 @@ class VisualizeData:
         legend: bool = True,
         map_title: str = "All MCWs",
         shapefile: bool = True,
+        cluster: Optional[bool] = None,
     ) -> folium.Map:
         """
         Visualize well data on a folium map.
@@ -353,6 +621,10 @@ class VisualizeData:
         shapefile: bool, optional
             Whether to include a shapefile on the map or not. Default is True
 
+        cluster : Optional[bool], optional
+            Whether to group nearby wells into clusters. Default is None, in which
+            case wells are clustered only for large data sets.
+
         Returns
         -------
         folium.Map
@@ -361,7 +633,7 @@ class VisualizeData:
         map_obj = self._create_map_with_legend(
             legend=legend, map_title=map_title, shapefile=shapefile
         )
-        self._add_well_markers(map_obj, well_type_to_plot)
+        self._add_well_markers(map_obj, well_type_to_plot, cluster)
 
         return map_obj
 
@@ -12,16 +12,101 @@
 #################################################################################
 
 # Standard libs
+import hashlib
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Optional
 
 # Installed libs
 import nbformat
+from jupyter_client.manager import KernelManager
 from nbconvert import HTMLExporter
-from nbconvert.preprocessors import ExecutePreprocessor
+from nbconvert.preprocessors import CellExecutionError, ExecutePreprocessor
 
 
-def process_notebook_with_config(
+def _get_cached_report_path(
     notebook_path: str, config_file: str, output_dir: str, kernel_name: str
+) -> str:
+    """
+    Returns the path where the HTML report of a notebook executed with a given
+    configuration file is cached. The Excel file generated by the notebook is
+    cached next to it with the .xlsx extension. Reports are keyed on a hash of
+    the kernel name and of the contents of the notebook and configuration files
+    only, so changes to other files read by the notebook (e.g., the well data)
+    are not detected.
+
+    Parameters
+    ----------
+    notebook_path : str
+        Path to the Jupyter Notebook (.ipynb) file
+    config_file : str
+        Path to the configuration JSON file to be used in the notebook
+    output_dir : str
+        Directory where the output HTML files are saved
+    kernel_name : str
+        Name of the kernel used to execute the notebook
+
+    Returns
+    -------
+    str
+        Path to the cached HTML report
+    """
+    digest = hashlib.sha1(kernel_name.encode())
+    for path in (notebook_path, config_file):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return os.path.join(output_dir, ".cache", f"{digest.hexdigest()}.html")
+
+
+def _inject_parameters(
+    nb: nbformat.NotebookNode, config_file: str, output_xlsx: str, reset: bool
+):
+    """
+    Defines the paths used by a notebook in a cell inserted at its top, as
+    papermill does, so that the notebook can refer to config_file and
+    output_xlsx directly. For compatibility, the default file names are also
+    replaced in every code cell of the notebook.
+
+    Parameters
+    ----------
+    nb : nbformat.NotebookNode
+        Notebook to modify in place
+    config_file : str
+        Path to the configuration JSON file to be used in the notebook
+    output_xlsx : str
+        Path to the Excel file generated by the notebook
+    reset : bool
+        Whether to clear the namespace of the kernel before the notebook runs
+
+    Returns
+    -------
+    None
+    """
+    for cell in nb.cells:
+        if cell.cell_type == "code":
+            cell.source = cell.source.replace("config.json", config_file).replace(
+                "Primo_projects.xlsx", output_xlsx
+            )
+
+    nb.cells.insert(
+        0,
+        nbformat.v4.new_code_cell(
+            ("%reset -f\n" if reset else "")
+            + f"config_file = {config_file!r}\noutput_xlsx = {output_xlsx!r}",
+            metadata={"tags": ["injected-parameters"]},
+        ),
+    )
+
+
+def process_notebook_with_config(  # pylint: disable=[too-many-arguments,too-many-positional-arguments,too-many-locals]
+    notebook_path: str,
+    config_file: str,
+    output_dir: str,
+    kernel_name: str,
+    force: bool = False,
+    km: Optional[KernelManager] = None,
 ):
     """
     Process a Jupyter Notebook with a given configuration file and generate an HTML file of the Notebook and the Excel file that the notebook generates.
@@ -34,33 +119,51 @@ def process_notebook_with_config(
         Path to the configuration JSON file to be used in the notebook
     output_dir : str
         Directory where the output HTML file and any generated Excel files will be saved
+    force : bool
+        Whether to execute the notebook even if it was already executed with the
+        same kernel, notebook and configuration files. Changes to other files
+        read by the notebook (e.g., the well data) are not detected, so force
+        must be set to True when they change. Default is False
+    km : Optional[KernelManager]
+        Manager of a kernel reused across notebooks. The kernel is started if
+        needed and kept alive afterwards, and its namespace is cleared before the
+        notebook runs. Default is None, in which case a new kernel is started and
+        shut down once the notebook has been executed
 
     Returns
     -------
     None
     """
+    config_filename = os.path.basename(config_file)
+    html_filename = os.path.join(output_dir, config_filename.replace(".json", ".html"))
+
+    cached_html = _get_cached_report_path(
+        notebook_path, config_file, output_dir, kernel_name
+    )
+    cached_xlsx = os.path.splitext(cached_html)[0] + ".xlsx"
+    output_xlsx = os.path.join(
+        output_dir, f'Primo_projects_{config_filename.replace(".json", ".xlsx")}'
+    )
+    if not force and os.path.exists(cached_html):
+        shutil.copyfile(cached_html, html_filename)
+        if os.path.exists(cached_xlsx):
+            shutil.copyfile(cached_xlsx, output_xlsx)
+        return
+
     # Read the notebook
     # The as_version=4 parameter specifies that the notebook should be read using the version 4 of the Jupyter Notebook format.
     with open(notebook_path) as f:
         nb = nbformat.read(f, as_version=4)
 
-    config_filename = os.path.basename(config_file)
-
-    # Replace the config file path in the notebook
-    for cell in nb.cells:
-        if cell.cell_type == "code" and "config.json" in cell.source:
-            cell.source = cell.source.replace("config.json", config_file)
-        if cell.cell_type == "code" and "Primo_projects.xlsx" in cell.source:
-            cell.source = cell.source.replace(
-                "Primo_projects.xlsx",
-                os.path.join(
-                    output_dir,
-                    f'Primo_projects_{config_filename.replace(".json", ".xlsx")}',
-                ),
-            )
+    _inject_parameters(nb, config_file, output_xlsx, reset=km is not None)
 
     ep = ExecutePreprocessor(kernel_name=kernel_name)
-    ep.preprocess(nb, {"metadata": {"path": os.path.dirname(notebook_path)}})
+    try:
+        ep.preprocess(nb, {"metadata": {"path": os.path.dirname(notebook_path)}}, km=km)
+    finally:
+        # The kernel client is only cleaned up when the kernel manager is not shared
+        if km is not None and ep.kc is not None:
+            ep.kc.stop_channels()
 
     # Convert the executed notebook to HTML
     html_exporter = HTMLExporter()
@@ -68,12 +171,80 @@ def process_notebook_with_config(
     body, _ = html_exporter.from_notebook_node(nb)
 
     # Save the HTML file
-    html_filename = os.path.join(output_dir, config_filename.replace(".json", ".html"))
     with open(html_filename, "w") as f:
         f.write(body)
+    os.makedirs(os.path.dirname(cached_html), exist_ok=True)
+    if os.path.exists(output_xlsx):
+        shutil.copyfile(output_xlsx, cached_xlsx)
+    shutil.copyfile(html_filename, cached_html)
+
+
+def _process_notebooks(
+    notebook_path: str,
+    config_files: List[str],
+    output_dir: str,
+    kernel_name: str,
+    force: bool,
+):
+    """
+    Process a Jupyter Notebook with several configuration files, reusing a single
+    kernel to avoid starting one for each configuration. The namespace of the
+    kernel is cleared with %reset -f between configurations, which does not
+    reset the state of imported modules (e.g., the root logger configured by the
+    first notebook). The kernel is restarted after a failed execution, and the
+    first error is raised once all the configurations have been processed.
+
+    Parameters
+    ----------
+    notebook_path : str
+        Path to the Jupyter Notebook (.ipynb) file
+    config_files : List[str]
+        Paths to the configuration JSON files to be used in the notebook
+    output_dir : str
+        Directory where the output HTML files and any generated Excel files will be saved
+    kernel_name : str
+        Name of the kernel used to execute the notebook
+    force : bool
+        Whether to execute notebooks whose inputs have not changed since they
+        were last executed
+
+    Returns
+    -------
+    None
+    """
+    km = KernelManager(kernel_name=kernel_name)
+    errors = []
+    try:
+        for config_file in config_files:
+            try:
+                process_notebook_with_config(
+                    notebook_path,
+                    config_file,
+                    output_dir,
+                    kernel_name,
+                    force=force,
+                    km=km,
+                )
+            except CellExecutionError as err:
+                # Execute the remaining configurations in a fresh kernel
+                errors.append(err)
+                km.restart_kernel(now=True)
+    finally:
+        if km.has_kernel:
+            km.shutdown_kernel(now=True)
+
+    if errors:
+        raise errors[0]
 
 
-def main(config_dir: str, notebook_path: str, output_dir: str, kernel_name: str):
+def main(  # pylint: disable=[too-many-arguments,too-many-positional-arguments]
+    config_dir: str,
+    notebook_path: str,
+    output_dir: str,
+    kernel_name: str,
+    max_workers: Optional[int] = None,
+    force: bool = False,
+):
     """
     Process a Jupyter Notebook with multiple configuration files and generate HTML reports for each.
 
@@ -85,6 +256,12 @@ def main(config_dir: str, notebook_path: str, output_dir: str, kernel_name: str)
         Path to the Jupyter Notebook (.ipynb) file
     output_dir : str
         Directory where the output HTML files and any generated Excel files will be saved
+    max_workers : Optional[int]
+        Maximum number of notebooks executed at the same time. Default is None,
+        in which case the number of processors of the machine is used
+    force : bool
+        Whether to execute notebooks whose inputs have not changed since they
+        were last executed. Default is False
 
     Returns
     -------
@@ -96,7 +273,23 @@ def main(config_dir: str, notebook_path: str, output_dir: str, kernel_name: str)
         if f.endswith(".json")
     ]
 
-    for config_file in config_files:
-        process_notebook_with_config(
-            notebook_path, config_file, output_dir, kernel_name
+    if not config_files:
+        return
+
+    # Each worker executes its share of the configurations one after the other in
+    # a single kernel, and each configuration writes to its own output files
+    num_workers = min(max_workers or os.cpu_count() or 1, len(config_files))
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        # Consume the results so that errors raised in workers are propagated
+        list(
+            executor.map(
+                partial(
+                    _process_notebooks,
+                    notebook_path,
+                    output_dir=output_dir,
+                    kernel_name=kernel_name,
+                    force=force,
+                ),
+                [config_files[i::num_workers] for i in range(num_workers)],
+            )
         )
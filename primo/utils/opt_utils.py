@@ -13,7 +13,7 @@
 
 # Standard libs
 import logging
-from typing import Dict, Tuple, Union
+from typing import Dict, Iterable, List, Tuple, Union
 
 # Installed libs
 import numpy as np
@@ -21,6 +21,9 @@ import pyomo.environ as pyo
 
 LOGGER = logging.getLogger(__name__)
 
+# Relative tolerance used when comparing values to 1.0, matching np.isclose
+_RELATIVE_TOL = 1e-5
+
 
 def is_binary_value(value: float, tol: float) -> bool:
     """
@@ -39,7 +42,8 @@ def is_binary_value(value: float, tol: float) -> bool:
         True if the value is 0 or 1
 
     """
-    return np.isclose(value, 0.0, atol=tol) or np.isclose(value, 1.0, atol=tol)
+    # Plain scalar arithmetic, since np.isclose is slow on scalars
+    return abs(value) <= tol or abs(value - 1.0) <= tol + _RELATIVE_TOL
 
 
 def is_integer_value(value: float, tol: float) -> bool:
@@ -59,7 +63,7 @@ def is_integer_value(value: float, tol: float) -> bool:
         True if the value is integral
 
     """
-    return np.isclose(np.round(value) - value, 0.0, atol=tol)
+    return abs(round(value) - value) <= tol
 
 
 def in_bounds(
@@ -99,6 +103,88 @@ def in_bounds(
     return True
 
 
+def _to_array(values: Iterable[Union[float, None]], default: float) -> np.ndarray:
+    """
+    Converts values to a float array, replacing missing values with a default.
+
+    Parameters
+    ----------
+    values : Iterable[Union[float, None]]
+        The values to be converted
+    default : float
+        The value used in place of None
+
+    Returns
+    -------
+    np.ndarray
+        Array of values
+
+    """
+    return np.fromiter(
+        (default if value is None else value for value in values), dtype=float
+    )
+
+
+def _get_bounds(components: List) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the lower and upper bounds of variables or constraints, where missing
+    bounds are set to -inf and inf respectively.
+
+    Parameters
+    ----------
+    components : List
+        The variable or constraint data objects
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Arrays of lower and upper bounds
+
+    """
+    lower_bounds = _to_array(
+        (
+            pyo.value(component.lower, exception=False) if component.has_lb() else None
+            for component in components
+        ),
+        -np.inf,
+    )
+    upper_bounds = _to_array(
+        (
+            pyo.value(component.upper, exception=False) if component.has_ub() else None
+            for component in components
+        ),
+        np.inf,
+    )
+    return lower_bounds, upper_bounds
+
+
+def _log_bound_violation(
+    kind: str, component, value: float, lower_bound: float, upper_bound: float
+) -> None:
+    """
+    Logs a variable or constraint whose value violates its bounds.
+
+    Parameters
+    ----------
+    kind : str
+        Either "Variable" or "Constraint"
+    component
+        The violating variable or constraint data object
+    value : float
+        The value of the variable or constraint body
+    lower_bound : float
+        The lower bound, -inf if the component has none
+    upper_bound : float
+        The upper bound, inf if the component has none
+
+    """
+    LOGGER.info(
+        f"{kind}: {component} with value: {value} violates bounds "
+        f"lower: {None if np.isneginf(lower_bound) else lower_bound}, "
+        f"upper: {None if np.isposinf(upper_bound) else upper_bound}"
+    )
+
+
 def is_pyomo_model_feasible(model: pyo.ConcreteModel, tol: float) -> bool:
     """
     Checks whether a Pyomo model solution is feasible subject to a tolerance.
@@ -118,51 +204,58 @@ def is_pyomo_model_feasible(model: pyo.ConcreteModel, tol: float) -> bool:
         True if the solution is feasible for the model; False otherwise
 
     """
-
-    for var in model.component_data_objects(ctype=pyo.Var, descend_into=True):
-        val = var.value
-        if val is None:
-            val = 0
-        lower_bound = None
-        upper_bound = None
-        if var.has_lb():
-            lower_bound = pyo.value(var.lower, exception=False)
-        if var.has_ub():
-            upper_bound = pyo.value(var.upper, exception=False)
-        if not in_bounds(val, lower_bound, upper_bound, tol):
+    # Collect variables and constraints in a single walk over the model blocks
+    variables = []
+    constraints = []
+    for component in model.component_data_objects(
+        ctype=(pyo.Var, pyo.Constraint), descend_into=True
+    ):
+        if component.ctype is pyo.Var:
+            variables.append(component)
+        else:
+            constraints.append(component)
+
+    # Check the bounds and domains of all variables at once. Variables without
+    # a value are treated as zero
+    values = _to_array((var.value for var in variables), 0.0)
+    lower_bounds, upper_bounds = _get_bounds(variables)
+    out_of_bounds = (values < lower_bounds - tol) | (values > upper_bounds + tol)
+    is_binary = np.fromiter((var.is_binary() for var in variables), dtype=bool)
+    is_integer = np.fromiter((var.is_integer() for var in variables), dtype=bool)
+    non_binary = is_binary & ~(
+        (np.abs(values) <= tol) | (np.abs(values - 1.0) <= tol + _RELATIVE_TOL)
+    )
+    non_integer = is_integer & ~is_binary & (np.abs(np.round(values) - values) > tol)
+
+    violated = out_of_bounds | non_binary | non_integer
+    if violated.any():
+        i = int(np.argmax(violated))
+        if out_of_bounds[i]:
+            _log_bound_violation(
+                "Variable", variables[i], values[i], lower_bounds[i], upper_bounds[i]
+            )
+        elif non_binary[i]:
             LOGGER.info(
-                f"Variable {var} with value: {val} violates bounds"
-                f" lower: {lower_bound}, upper: {upper_bound}"
+                f"Variable: {variables[i]} took a non-binary value: {values[i]}"
             )
-            return False
-
-        if var.is_binary():
-            if not is_binary_value(val, tol):
-                LOGGER.info(f"Variable: {var} took a non-binary value: {val}")
-                return False
-
-        if var.is_integer():
-            if not is_integer_value(val, tol):
-                LOGGER.info(f"Variable: {var} took a non-integer value: {val}")
-                return False
-
-    for con in model.component_data_objects(ctype=pyo.Constraint, descend_into=True):
-        val = pyo.value(con.body, exception=False)
-        if val is None:
-            val = 0
-        lower_bound = None
-        upper_bound = None
-
-        if con.has_lb():
-            lower_bound = pyo.value(con.lower, exception=False)
-        if con.has_ub():
-            upper_bound = pyo.value(con.upper, exception=False)
-        if not in_bounds(val, lower_bound, upper_bound, tol):
+        else:
             LOGGER.info(
-                f"Constraint: {con} with value: {val} violated bounds "
-                f"lower: {lower_bound}, upper: {upper_bound}"
+                f"Variable: {variables[i]} took a non-integer value: {values[i]}"
             )
-            return False
+        return False
+
+    # Constraint bodies that cannot be evaluated are treated as zero
+    values = _to_array(
+        (pyo.value(con.body, exception=False) for con in constraints), 0.0
+    )
+    lower_bounds, upper_bounds = _get_bounds(constraints)
+    violated = (values < lower_bounds - tol) | (values > upper_bounds + tol)
+    if violated.any():
+        i = int(np.argmax(violated))
+        _log_bound_violation(
+            "Constraint", constraints[i], values[i], lower_bounds[i], upper_bounds[i]
+        )
+        return False
 
     return True
 
@@ -191,23 +284,23 @@ def budget_slack_variable_scaling(
 
     """
     # estimate the maximum number of wells can be plugged with the budget.
-    unit_cost = max(model_inputs.mobilization_cost.values()) / max(
-        model_inputs.mobilization_cost, key=model_inputs.mobilization_cost.get
-    )
+    # mobilization_cost maps a number of wells to the cost of plugging them,
+    # so the unit cost is the largest cost divided by its number of wells
+    mobilization_cost = model_inputs.mobilization_cost
+    max_cost_num_wells = max(mobilization_cost, key=mobilization_cost.__getitem__)
+    unit_cost = mobilization_cost[max_cost_num_wells] / max_cost_num_wells
     max_well_num = model_inputs.budget / unit_cost
 
+    num_wells = len(objective_weights)
+    max_weight = max(objective_weights.values())
     # calculate the scaling factor for the budget slack variable if the
     # budget is not sufficient to plug all wells
-    if max_well_num < len(objective_weights):
-        scaling_budget_slack = (
-            max_well_num * max(objective_weights.values())
-        ) / model_inputs.budget
+    if max_well_num < num_wells:
+        scaling_budget_slack = (max_well_num * max_weight) / model_inputs.budget
         budget_sufficient = False
     # calculate the scaling factor for the budget slack variable if the
     # budget is sufficient to plug all wells
     else:
-        scaling_budget_slack = (
-            len(objective_weights) * max(objective_weights.values())
-        ) / model_inputs.budget
+        scaling_budget_slack = (num_wells * max_weight) / model_inputs.budget
         budget_sufficient = True
     return scaling_budget_slack, budget_sufficient
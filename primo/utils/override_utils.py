@@ -12,12 +12,12 @@
 #################################################################################
 
 # Standard libs
-import copy
 import logging
-from itertools import combinations
+from itertools import chain
 from typing import Dict
 
 # Installed libs
+import numpy as np
 import pandas as pd
 
 # User-defined libs
@@ -27,7 +27,7 @@ from primo.utils.clustering_utils import distance_matrix
 LOGGER = logging.getLogger(__name__)
 
 
-class AssessFeasibility:
+class AssessFeasibility:  # pylint: disable=too-many-instance-attributes
     """
     Class for assessing whether the P&A projects adhere to the constraints
     defined in the optimization problem.
@@ -61,11 +61,19 @@ class AssessFeasibility:
         self.wd = wd
         self.plug_list = plug_list
         self.campaign_cost_dict = {}
+        self._distance_matrix = None
 
+        # Row positions of the selected wells in the well data, computed once
+        # and shared by the assessments below
+        well_index = self.wd.data.index
+        self._plug_positions = well_index.get_indexer(self.plug_list)
+        self._project_positions = {}
+
+        # get_mobilization_cost rebuilds the scaled cost dict on every access
+        mobilization_cost = self.opt_inputs.get_mobilization_cost
         for cluster, groups in self.new_campaign.items():
-            n_wells = len(groups)
-            campaign_cost = self.opt_inputs.get_mobilization_cost[n_wells]
-            self.campaign_cost_dict[cluster] = campaign_cost
+            self.campaign_cost_dict[cluster] = mobilization_cost[len(groups)]
+            self._project_positions[cluster] = well_index.get_indexer(groups)
 
     def assess_budget(self) -> float:
         """
@@ -73,11 +81,7 @@ class AssessFeasibility:
         amount by which the budget is violated. A 0 or negative value indicates
         that we are still under budget
         """
-        total_cost = 0
-
-        total_cost = sum(
-            project_cost for _, project_cost in self.campaign_cost_dict.items()
-        )
+        total_cost = sum(self.campaign_cost_dict.values())
 
         return round((total_cost - self.opt_inputs.get_total_budget) * 1e6)
 
@@ -94,12 +98,10 @@ class AssessFeasibility:
             # this constraint becomes meaningless
             return 0
 
-        disadvantaged_wells = 0
-
         # count number of wells that exceed threshold based on disadvantaged
         # community score
-        disadvantaged_wells = sum(
-            self.wd.data.loc[well, "is_disadvantaged"] for well in self.plug_list
+        disadvantaged_wells = (
+            self.wd.data["is_disadvantaged"].to_numpy()[self._plug_positions].sum()
         )
         dac_percent = disadvantaged_wells / len(self.plug_list) * 100
 
@@ -119,17 +121,34 @@ class AssessFeasibility:
             # or does not wish to prioritize
             # this constraint becomes meaningless
             return {}
-        violated_operators = {}
-        for operator, groups in self.wd.data.groupby(self.wd._col_names.operator_name):
-            n_wells = len(groups)
-            if n_wells > self.opt_inputs.config.max_wells_per_owner:
-                violated_operators.setdefault("Owner", []).append(operator)
-                violated_operators.setdefault("Number of wells", []).append(n_wells)
-                violated_operators.setdefault("Wells", []).append(
-                    groups[self.wd._col_names.well_id].to_list()
-                )
+        operator_col = self.wd._col_names.operator_name
+        n_wells = self.wd.data.groupby(operator_col).size()
+        n_wells = n_wells[n_wells > max_wells_per_owner]
+        if n_wells.empty:
+            return {}
+
+        # Collect the wells only for the owners violating the constraint
+        violated_data = self.wd.data[self.wd.data[operator_col].isin(n_wells.index)]
+        wells = violated_data.groupby(operator_col)[self.wd._col_names.well_id].agg(
+            list
+        )
+
+        return {
+            "Owner": n_wells.index.to_list(),
+            "Number of wells": n_wells.to_list(),
+            "Wells": wells.loc[n_wells.index].to_list(),
+        }
 
-        return violated_operators
+    def _get_distance_matrix(self) -> pd.DataFrame:
+        """
+        Returns the distance matrix of the wells being plugged, which is built
+        once and reused by later feasibility assessments
+        """
+        if self._distance_matrix is None:
+            # Assign weight for distance as 1 to ensure the distance matrix returns
+            # physical distance between two well pairs
+            self._distance_matrix = distance_matrix(self.wd, {"distance": 1})
+        return self._distance_matrix
 
     def assess_distances(self) -> Dict:
         # pylint: disable=protected-access
@@ -137,32 +156,44 @@ class AssessFeasibility:
         Assess whether the maximum distance between two wells constraint is violated or not
         """
         distance_threshold = self.opt_inputs.config.threshold_distance
-        distance_violation = {}
-        # Assign weight for distance as 1 to ensure the distance matrix returns physical
-        # distance between two well pairs
-        metric_array = distance_matrix(self.wd, {"distance": 1})
-
-        for cluster, well_list in self.new_campaign.items():
-            for w1, w2 in combinations(well_list, 2):
-                well_distance = metric_array.loc[w1, w2]
-                if well_distance > distance_threshold:
-                    distance_violation.setdefault("Project", []).append(cluster)
-                    distance_violation.setdefault("Well 1", []).append(
-                        self.wd.data.loc[w1][self.wd._col_names.well_id]
-                    )
-                    distance_violation.setdefault("Well 2", []).append(
-                        self.wd.data.loc[w2][self.wd._col_names.well_id]
-                    )
-                    distance_violation.setdefault(
-                        "Distance between Well 1 and 2 [Miles]", []
-                    ).append(well_distance)
-
-        return distance_violation
+        if not self._project_positions:
+            return {}
+
+        # Positions of the wells of each intra-project pair, in the same order
+        # as itertools.combinations, gathered across all projects so that the
+        # threshold is checked in a single pass
+        projects = list(self._project_positions)
+        pair_project, pair_i, pair_j = [], [], []
+        for project_pos, idx in enumerate(self._project_positions.values()):
+            first, second = np.triu_indices(len(idx), 1)
+            pair_project.append(np.full(len(first), project_pos))
+            pair_i.append(idx[first])
+            pair_j.append(idx[second])
+
+        pair_project = np.concatenate(pair_project)
+        pair_i = np.concatenate(pair_i)
+        pair_j = np.concatenate(pair_j)
+
+        # The distance matrix shares the row order of the well data
+        pair_distances = self._get_distance_matrix().to_numpy()[pair_i, pair_j]
+        violated = pair_distances > distance_threshold
+        if not violated.any():
+            return {}
+
+        well_ids = self.wd.data[self.wd._col_names.well_id].to_numpy()
+        return {
+            "Project": [projects[pos] for pos in pair_project[violated]],
+            "Well 1": well_ids[pair_i[violated]].tolist(),
+            "Well 2": well_ids[pair_j[violated]].tolist(),
+            "Distance between Well 1 and 2 [Miles]": pair_distances[violated].tolist(),
+        }
 
     def assess_feasibility(self) -> bool:
         """
         Assesses whether current set of selections is feasible
         """
+        # Checks are ordered from cheapest to most expensive, so that the
+        # distance matrix is only built when all other constraints hold
         if self.assess_budget() > 0:
             return False
 
@@ -208,8 +239,11 @@ class OverrideCampaign:
         opt_campaign: Dict,
         eff_metrics,
     ):
-        opt_campaign_copy = copy.deepcopy(opt_campaign)
-        self.new_campaign = opt_campaign_copy
+        # Copy the well lists so that modifying the campaign leaves the
+        # original suggested projects untouched
+        self.new_campaign = {
+            cluster: list(well_list) for cluster, well_list in opt_campaign.items()
+        }
         self.remove = override_selections.remove_widget_return
         self.add = override_selections.add_widget_return
         self.lock = override_selections.lock_widget_return
@@ -218,11 +252,10 @@ class OverrideCampaign:
 
         # change well cluster
         self._modify_campaign()
-        self.plug_list = []
-        for _, well_list in self.new_campaign.items():
-            self.plug_list += well_list
-        # prevent duplication in plug_list
-        self.plug_list = list(set(self.plug_list))
+        # prevent duplication in plug_list, keeping the campaign order
+        self.plug_list = list(
+            dict.fromkeys(chain.from_iterable(self.new_campaign.values()))
+        )
         self.well_data = self.opt_inputs.config.well_data._construct_sub_data(
             self.plug_list
         )
@@ -242,8 +275,12 @@ class OverrideCampaign:
         # remove wells
         for cluster, well_list in self.remove.well.items():
             if cluster not in self.remove.cluster:
-                for well in well_list:
-                    self.new_campaign[cluster].remove(well)
+                removed_wells = set(well_list)
+                self.new_campaign[cluster] = [
+                    well
+                    for well in self.new_campaign[cluster]
+                    if well not in removed_wells
+                ]
 
         # add well with new cluster
         for cluster, well_list in self.add.new_clusters.items():
@@ -254,13 +291,16 @@ class OverrideCampaign:
         Return information on constraints that the new campaign
         have violated.
         """
+        # Evaluate each constraint once; the project is feasible exactly
+        # when none of them is violated (see AssessFeasibility.assess_feasibility)
+        violate_cost = self.feasibility.assess_budget()
+        violate_dac = self.feasibility.assess_dac()
+        violate_operator = self.feasibility.assess_owner_well_count()
+        violate_distance = self.feasibility.assess_distances()
+
         violation_info_dict = {}
-        if self.feasibility.assess_feasibility() is False:
+        if violate_cost > 0 or violate_dac > 0 or violate_operator or violate_distance:
             violation_info_dict = {"Project Status:": "INFEASIBLE"}
-            violate_cost = self.feasibility.assess_budget()
-            violate_operator = self.feasibility.assess_owner_well_count()
-            violate_distance = self.feasibility.assess_distances()
-            violate_dac = self.feasibility.assess_dac()
 
             if violate_cost > 0:
                 msg = (
@@ -11,16 +11,62 @@
 # perform publicly and display publicly, and to permit others to do so.
 #################################################################################
 
-# Standard libs
-from math import radians
-
 # Installed libs
-import pandas as pd
+import numpy as np
+from sklearn.metrics.pairwise import haversine_distances
 from sklearn.neighbors import BallTree
 
 # User-defined libs
 from primo.utils import EARTH_RADIUS
 
+# Largest number of well-target pairs for which distances are computed
+# directly instead of through a BallTree
+_BRUTE_FORCE_MAX_PAIRS = 1_000_000
+
+
+def _get_coordinates_in_radians(df, lat_col, lon_col):
+    """
+    Returns the coordinates of the rows with a known location in radians,
+    along with the boolean mask of those rows. Missing and zero-valued
+    latitudes/longitudes are treated as unknown.
+    """
+    coordinates = df[[lat_col, lon_col]].to_numpy(dtype=float)
+    located = np.all(np.isfinite(coordinates) & (coordinates != 0), axis=1)
+    return np.radians(coordinates[located]), located
+
+
+def _count_nearby(well_coordinates, target_coordinates, radius):
+    """
+    Returns the number of targets within radius of each well. Coordinates
+    and radius are in radians.
+    """
+    if len(well_coordinates) * len(target_coordinates) <= _BRUTE_FORCE_MAX_PAIRS:
+        # For small inputs, checking every pair is cheaper than building a tree
+        return np.count_nonzero(
+            haversine_distances(well_coordinates, target_coordinates) <= radius,
+            axis=1,
+        )
+
+    if len(target_coordinates) < len(well_coordinates):
+        # Build the tree on the smaller set of targets and count the targets
+        # near each well directly
+        target_ball_tree = BallTree(target_coordinates, metric="haversine")
+        return target_ball_tree.query_radius(
+            well_coordinates, r=radius, count_only=True
+        )
+
+    well_ball_tree = BallTree(well_coordinates, metric="haversine")
+    neighbors_within_distance = well_ball_tree.query_radius(
+        target_coordinates, r=radius
+    )
+
+    # The tree returns row positions of the wells near each target, so the
+    # number of nearby targets of a well is the number of times it appears
+    return np.bincount(
+        np.concatenate([np.empty(0, dtype=np.intp), *neighbors_within_distance]),
+        minlength=len(well_coordinates),
+    )
+
 
 def calculate_nearby_count(
     well_df,
@@ -60,40 +106,19 @@ def calculate_nearby_count(
     well_lat_col, well_lon_col = well_coordinates
     target_lat_col, target_lon_col = target_coordinates
 
-    # Convert 0 values to NaN
-    well_df[[well_lat_col, well_lon_col]] = well_df[
-        [well_lat_col, well_lon_col]
-    ].replace(0, pd.NaT)
-    well_df = well_df.dropna(subset=[well_lat_col, well_lon_col])
-
-    well_df["well_lat_rad"] = well_df[well_lat_col].apply(radians)
-    well_df["well_lon_rad"] = well_df[well_lon_col].apply(radians)
-
-    target_df[[target_lat_col, target_lon_col]] = target_df[
-        [target_lat_col, target_lon_col]
-    ].replace(0, pd.NaT)
-    target_df = target_df.dropna(subset=[target_lat_col, target_lon_col])
-
-    target_df["target_lat_rad"] = target_df[target_lat_col].apply(radians)
-    target_df["target_lon_rad"] = target_df[target_lon_col].apply(radians)
-
-    well_coordinates = well_df[["well_lat_rad", "well_lon_rad"]].to_numpy()
-    target_coordinates = target_df[["target_lat_rad", "target_lon_rad"]].to_numpy()
-
-    well_ball_tree = BallTree(well_coordinates, metric="haversine")
-
-    neighbors_within_distance = well_ball_tree.query_radius(
-        target_coordinates, r=distance_miles / EARTH_RADIUS
+    well_coordinates, well_located = _get_coordinates_in_radians(
+        well_df, well_lat_col, well_lon_col
+    )
+    target_coordinates, _ = _get_coordinates_in_radians(
+        target_df, target_lat_col, target_lon_col
     )
 
-    well_df[distance_column_name] = 0  # Initialize with zeros
-
-    for neighbors in neighbors_within_distance:
-        well_df.loc[well_df.index.isin(neighbors), distance_column_name] += 1
-
-    well_df = well_df.drop(["well_lat_rad", "well_lon_rad"], axis=1)
+    nearby_count = _count_nearby(
+        well_coordinates, target_coordinates, distance_miles / EARTH_RADIUS
+    )
 
-    return well_df
+    # Wells without coordinates are dropped from the result
+    return well_df.loc[well_located].assign(**{distance_column_name: nearby_count})
 
 
 def nearby_total_school_count(
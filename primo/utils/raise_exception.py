@@ -33,10 +33,7 @@ def raise_exception(msg: str, exception_type: Exception) -> None:
     exception_type
         The specified exception with the provided message
     """
-    try:
-        raise exception_type(msg)
-    except:
-        # Try-except block ensures that the stacktrace is captured in a log file
-        # if one is configured
-        LOGGER.exception(msg)
-        raise
+    # Log the caller's stack so that it is captured in a log file if one is
+    # configured, without raising and catching the exception first
+    LOGGER.error(msg, stack_info=True, stacklevel=2)
+    raise exception_type(msg)
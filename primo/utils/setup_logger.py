@@ -12,19 +12,32 @@
 #################################################################################
 
 # Standard libs
+import atexit
 import logging
+import logging.handlers
 import os
 import pathlib
+import queue
 import sys
 
 # User-defined libs
 from primo.utils.raise_exception import raise_exception
 
+_DEVNULL = pathlib.Path(os.devnull)
+
+# Map from the log_level argument to the logging level
+_SUPPORTED_LOG_LEVELS = {
+    0: logging.CRITICAL,
+    1: logging.WARNING,
+    2: logging.INFO,
+    3: logging.DEBUG,
+}
+
 
 def setup_logger(
     log_level: int = 2,
     log_to_console: bool = True,
-    log_file: pathlib.Path = pathlib.Path(os.devnull),
+    log_file: pathlib.Path = _DEVNULL,
 ):
     """
     Set up logging objects based on user input.
@@ -52,13 +65,7 @@ def setup_logger(
         If the log_file specified already exists or if an invalid value for
         log_level is provided
     """
-    supported_log_levels = {
-        0: logging.CRITICAL,
-        1: logging.WARNING,
-        2: logging.INFO,
-        3: logging.DEBUG,
-    }
-    if log_level not in supported_log_levels:
+    if log_level not in _SUPPORTED_LOG_LEVELS:
         raise_exception(
             f"Invalid value for log_level: {log_level}. Acceptable values are: [0, 1, 2, 3]",
             ValueError,
@@ -69,13 +76,20 @@ def setup_logger(
         stdout_handler = logging.StreamHandler(sys.stdout)
         handlers.append(stdout_handler)
 
-    if log_file != pathlib.Path(os.devnull):
+    if log_file != _DEVNULL:
         if os.path.exists(log_file):
             raise_exception(
                 f"Log file: {str(log_file)} already exists. Please specify new log file.",
                 ValueError,
             )
-        file_handler = logging.FileHandler(log_file)
+        # Buffer records and write them to the file in batches, flushing
+        # right away only for errors
+        file_handler = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=logging.FileHandler(log_file),
+            flushOnClose=True,
+        )
         handlers.append(file_handler)
 
     if log_level in [0, 1, 2]:
@@ -90,13 +104,28 @@ def setup_logger(
         )
         logger_date = "%d-%b-%y %H:%M:%S"
 
+    listener = None
+    if handlers:
+        # Records are written by a background thread, so that console and file
+        # I/O does not block the optimization
+        listener = logging.handlers.QueueListener(
+            queue.SimpleQueue(), *handlers, respect_handler_level=True
+        )
+        handlers = [logging.handlers.QueueHandler(listener.queue)]
+
     logging.basicConfig(
-        level=supported_log_levels[log_level],
+        level=_SUPPORTED_LOG_LEVELS[log_level],
         format=logger_format,
         datefmt=logger_date,
         handlers=handlers,
     )
 
+    # basicConfig does nothing if the root logger is already configured
+    if listener is not None and handlers[0] in logging.getLogger().handlers:
+        listener.start()
+        # Write out the pending records before the interpreter exits
+        atexit.register(listener.stop)
+
     # Prevents double log output when the solver is called
     logger = logging.getLogger("gurobipy")
     logger.propagate = False
@@ -13,6 +13,7 @@
 
 # Standard libs
 import logging
+from functools import lru_cache
 
 # Installed libs
 from pyomo.contrib.appsi.base import TerminationCondition
@@ -21,6 +22,35 @@ from pyomo.environ import check_optimal_termination as pyo_opt_term
 
 LOGGER = logging.getLogger(__name__)
 
+# Names accepted for the HiGHS solver
+_HIGHS_SOLVERS = frozenset({"highs", "appsi_highs"})
+
+_GUROBI_SOLVERS = frozenset({"gurobi", "gurobi_persistent"})
+
+# Solvers whose results can be checked with pyomo's check_optimal_termination
+_PYO_OPT_TERM_SOLVERS = frozenset({"glpk", "gurobi", "gurobi_persistent", "scip"})
+
+
+@lru_cache(maxsize=None)
+def _get_default_solver():
+    """
+    Returns the name of the first available solver in order of priority,
+    or None if none of them is available. Checking availability builds a
+    solver object and may look up the solver executable, so the result is
+    computed once per session.
+    """
+    for solver_name in (
+        "gurobi_persistent",
+        "gurobi",
+        "scip",
+        "glpk",
+        "appsi_highs",
+    ):
+        if SolverFactory(solver_name).available(exception_flag=False):
+            return solver_name
+
+    return None
+
 
 def get_solver(
     solver: str = None,
@@ -68,23 +98,14 @@ def get_solver(
         solver_options = {}
 
     if solver is None:
-        # Auto-detect solver in order of priority
-        for solver_name in (
-            "gurobi_persistent",
-            "gurobi",
-            "scip",
-            "glpk",
-            "appsi_highs",
-        ):
-            if SolverFactory(solver_name).available(exception_flag=False):
-                LOGGER.warning(
-                    f"Optimization solver is not specified. "
-                    f"Using {solver_name} as the optimization solver."
-                )
-                solver = solver_name
-                break
-
-    if solver in "appsi_highs":
+        solver = _get_default_solver()
+        if solver is not None:
+            LOGGER.warning(
+                f"Optimization solver is not specified. "
+                f"Using {solver} as the optimization solver."
+            )
+
+    if solver in _HIGHS_SOLVERS:
         sol_obj = SolverFactory("appsi_highs")
         sol_obj.config.stream_solver = stream_output
         sol_obj.config.mip_gap = mip_gap
@@ -96,7 +117,7 @@ def get_solver(
 
         return sol_obj
 
-    if solver in ("gurobi", "gurobi_persistent"):
+    if solver in _GUROBI_SOLVERS:
         sol_obj = SolverFactory(solver, solver_io="python")
         sol_obj.options["MIPGap"] = mip_gap
         sol_obj.options["TimeLimit"] = time_limit
@@ -147,7 +168,7 @@ def check_optimal_termination(results, solver):
         Supported solvers include highs, gurobi, scip, and glpk
     """
 
-    if solver in ["glpk", "gurobi", "gurobi_persistent", "scip"]:
+    if solver in _PYO_OPT_TERM_SOLVERS:
         # This works for Gurobi, SCIP, and GLPK, but not for HiGHS
         return pyo_opt_term(results)
 
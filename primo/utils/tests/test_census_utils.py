@@ -11,7 +11,11 @@
 # perform publicly and display publicly, and to permit others to do so.
 #################################################################################
 
+# Standard libs
+from unittest.mock import MagicMock
+
 # Installed libs
+import pandas as pd
 import pytest
 
 # User-defined libs
@@ -19,6 +23,7 @@ from primo.utils.census_utils import (
     get_block,
     get_block_group,
     get_county,
+    get_data_as_geodataframe,
     get_fips_code,
     get_state,
     get_tract,
@@ -33,6 +38,20 @@ def test_get_state():
         assert get_state("")
 
 
+def test_get_data_as_geodataframe():
+    df = pd.DataFrame({"Latitude": [40.0, 41.5], "Longitude": [-80.0, -79.5]})
+    data = MagicMock()
+    data.data = df
+    data.column_names.latitude = "Latitude"
+    data.column_names.longitude = "Longitude"
+    data.__getitem__.side_effect = df.__getitem__
+
+    gdf = get_data_as_geodataframe(data)
+    assert gdf.crs.to_string() == "EPSG:4326"
+    assert list(gdf.geometry.x) == [-80.0, -79.5]
+    assert list(gdf.geometry.y) == [40.0, 41.5]
+
+
 def test_get_county():
     assert get_county("53065") == "065"
     assert get_county("53065950101") == "065"
@@ -15,7 +15,14 @@
 import pytest
 
 # User-defined libs
-from primo.utils.geo_utils import get_distance, is_in_bounds
+from primo.utils import geo_utils
+from primo.utils.geo_utils import (
+    get_distance,
+    get_nearest_neighbors,
+    is_acceptable,
+    is_in_bounds,
+    visualize_bing_maps_route,
+)
 
 
 @pytest.mark.parametrize(
@@ -35,6 +42,9 @@ from primo.utils.geo_utils import get_distance, is_in_bounds
 )
 def test_get_distance(origin, dest, distance):
     assert get_distance(origin, dest) == pytest.approx(distance, 0.001)
+    assert get_distance(origin, dest, distance_unit="KMS") == pytest.approx(
+        distance * 1.609344, 0.001
+    )
 
 
 def test_is_in_bounds():
@@ -46,4 +56,66 @@ def test_is_in_bounds():
         assert is_in_bounds(2.7, "float", 3.0, None, True)
 
 
+def test_is_acceptable():
+    assert is_acceptable("MILES", {"MILES", "KMS"}, "distance_unit")
+    assert not is_acceptable(3, {1, 2}, "integer")
+
+    # Non-string valid arguments are listed in the error message
+    with pytest.raises(ValueError, match="Allowable values are: 1,2"):
+        is_acceptable(3, {1, 2}, "integer", True)
+
+    # Distance functions report invalid arguments through is_acceptable
+    with pytest.raises(ValueError, match="Allowable values are: haversine"):
+        get_distance((40.44, -79.94), (40.44, -79.95), distance_type="euclidean")
+    with pytest.raises(ValueError, match="not a valid argument for distance_unit"):
+        get_distance((40.44, -79.94), (40.44, -79.95), distance_unit="METERS")
+    with pytest.raises(ValueError, match="not a valid argument for distance_unit"):
+        get_nearest_neighbors([(40.44, -79.94)], 1.0, "METERS")
+
+
+@pytest.mark.parametrize("max_points", [500, 0])
+def test_get_nearest_neighbors(max_points, monkeypatch):
+    # max_points = 0 forces the BallTree code path
+    monkeypatch.setattr(geo_utils, "_BRUTE_FORCE_MAX_POINTS", max_points)
+    # Points are roughly 0.53 miles (0.85 km) apart along the same latitude
+    points = [(40.44, -79.94), (40.44, -79.95), (40.44, -79.96)]
+    assert get_nearest_neighbors(points, 0.6) == [1, 2, 1]
+    assert get_nearest_neighbors(points, 1.1) == [2, 2, 2]
+    assert get_nearest_neighbors(points, 0.6, "KMS") == [0, 0, 0]
+    assert get_nearest_neighbors(points, 1.0, "KMS") == [1, 2, 1]
+
+    with pytest.raises(ValueError):
+        get_nearest_neighbors(points, 1.0, "METERS")
+
+
+def test_get_nearest_neighbors_reuses_ball_tree(monkeypatch):
+    monkeypatch.setattr(geo_utils, "_BRUTE_FORCE_MAX_POINTS", 0)
+    points = [(40.44, -79.94), (40.44, -79.95), (40.44, -79.96)]
+    geo_utils._build_ball_tree.cache_clear()
+    for cutoff in [0.6, 1.1]:
+        get_nearest_neighbors(points, cutoff)
+    assert geo_utils._build_ball_tree.cache_info().hits == 1
+
+    ball_tree = geo_utils._build_ball_tree(tuple(points))
+    assert get_nearest_neighbors(points, 0.6, ball_tree=ball_tree) == [1, 2, 1]
+
+
+def test_visualize_bing_maps_route():
+    route = {
+        "routeLegs": [
+            {
+                "travelDistance": 1.2346,
+                "travelDuration": 60,
+                "line": {"coordinates": [[40.44, -79.94], [40.45, -79.95]]},
+            },
+            {"travelDistance": 2.0, "travelDuration": 30},
+        ]
+    }
+    waypoints = [(40.44, -79.94), (40.45, -79.95)]
+    map_, total_distance, total_duration = visualize_bing_maps_route(route, waypoints)
+    assert total_distance == pytest.approx(3.235)
+    assert total_duration == 90
+    assert "Waypoint 2" in map_.get_root().render()
+
+
 # TODO: Add tests for is_valid_lat, is_valid_long, is_valid_geopoint, is_valid_args
@@ -208,6 +208,10 @@ def test_process_data(well_data, project_scores, centroids):
     result = process_data(well_df, centroids)
     assert_frame_equal(result, project_score_df, check_exact=False, atol=0.01)
 
+    # Columns are validated once on the full DataFrame
+    with pytest.raises(ValueError):
+        process_data(pd.DataFrame(WELL_DATA_MISSING_VALUES), centroids)
+
 
 # Run tests
 if __name__ == "__main__":
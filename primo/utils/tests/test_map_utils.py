@@ -12,17 +12,27 @@
 #################################################################################
 
 # Standard libs
+import json
 import os
+import tempfile
 from unittest.mock import MagicMock, patch
 
 # Installed libs
 import folium
 import geopandas as gpd
 import pytest
-from shapely.geometry import Point
+from folium.plugins import FastMarkerCluster
+from shapely.geometry import Point, Polygon, box
 
 # User-defined libs
-from primo.utils.map_utils import VisualizeData, get_cluster_colors
+from primo.utils.map_utils import (
+    VisualizeData,
+    _get_cache_dir,
+    _get_point_features,
+    _load_state_shapefile,
+    get_cluster_color_array,
+    get_cluster_colors,
+)
 
 
 def test_get_cluster_colors():
@@ -39,14 +49,37 @@ def test_get_cluster_colors():
 
     result = get_cluster_colors(cluster_list)
     assert result == expected_output
+    assert get_cluster_colors(range(13))[11] == "red"
+
+    # Colors are reused once the palette is exhausted
+    assert list(get_cluster_color_array([0, 2, 11, 13])) == [
+        "red",
+        "green",
+        "red",
+        "green",
+    ]
 
 
-def test_get_state_shapefile():
+def test_get_point_features():
+    """
+    Test that _get_point_features builds one GeoJSON point feature per location
+    with the given properties.
+    """
+    result = _get_point_features([1.0, 2.0], [3.0, 4.0], popup=["a", "b"])
+
+    assert result["type"] == "FeatureCollection"
+    assert len(result["features"]) == 2
+    assert result["features"][1]["geometry"]["coordinates"] == [4.0, 2.0]
+    assert result["features"][1]["properties"] == {"popup": "b"}
+
+
+def test_get_state_shapefile(tmp_path, monkeypatch):
     """
     Test the _get_state_shapefile method by mocking file handling and shapefile operations
     to avoid local file creation.
     """
     # pylint: disable=protected-access
+    monkeypatch.setenv("PRIMO_CACHE_DIR", str(tmp_path))
     # Mock dependencies
     mock_download_file = MagicMock()
     mock_unzip_file = MagicMock()
@@ -67,13 +100,21 @@ def test_get_state_shapefile():
         well_data = MagicMock()
         visualize_data = VisualizeData(well_data, "", "", "")
 
+        _load_state_shapefile.cache_clear()
         result = visualize_data._get_state_shapefile(
             shpfile_name, shpfile_url, shp_name
         )
 
+        # The shapefile is only downloaded once per process
+        result_2 = VisualizeData(well_data, "", "", "")._get_state_shapefile(
+            shpfile_name, shpfile_url, shp_name
+        )
+        assert mock_download_file.call_count == 1
+        assert result_2 is not result
+
         # Assertions
         mock_download_file.assert_called_with(
-            os.path.join(os.getcwd(), "temp", shpfile_name), shpfile_url
+            os.path.join(str(tmp_path), shpfile_name), shpfile_url
         )
         mock_unzip_file.assert_called()
         assert isinstance(result, gpd.GeoDataFrame)
@@ -82,6 +123,134 @@ def test_get_state_shapefile():
             result.crs.to_string() == "EPSG:4269"
         )  # Check that the CRS is set correctly
 
+        # Later processes load the reprojected shapefile saved on disk
+        _load_state_shapefile.cache_clear()
+        mock_unzip_file.reset_mock()
+        result_3 = visualize_data._get_state_shapefile(
+            shpfile_name, shpfile_url, shp_name
+        )
+        assert mock_download_file.call_count == 1
+        mock_unzip_file.assert_not_called()
+        assert result_3.crs.to_string() == "EPSG:4269"
+        assert result_3.geometry.equals(result.geometry)
+
+
+def test_get_cache_dir(tmp_path, monkeypatch):
+    """
+    Test that shapefiles are stored in the directory given by PRIMO_CACHE_DIR, or
+    in the temporary directory of the system otherwise.
+    """
+    # pylint: disable=protected-access
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("PRIMO_CACHE_DIR", str(cache_dir))
+    assert _get_cache_dir() == str(cache_dir)
+    assert cache_dir.is_dir()
+
+    monkeypatch.delenv("PRIMO_CACHE_DIR")
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    assert _get_cache_dir() == os.path.join(str(tmp_path), "primo_shapefiles")
+
+
+def test_get_county_labels():
+    """
+    Test that _get_county_labels finds the county name column and a label point
+    inside every county, and caches the result.
+    """
+    # pylint: disable=protected-access
+    visualize_data = VisualizeData(MagicMock(), "", "", "")
+    visualize_data.state_shapefile = gpd.GeoDataFrame(
+        {"COUNTY": ["A", "B"]},
+        geometry=[box(-80.0, 40.0, -79.0, 41.0), box(-79.0, 40.0, -78.0, 42.0)],
+        crs="EPSG:4269",
+    )
+
+    names, lats, lons = visualize_data._get_county_labels()
+    assert list(names) == ["A", "B"]
+    assert list(lats) == pytest.approx([40.5, 41.0])
+    assert list(lons) == pytest.approx([-79.5, -78.5])
+    assert visualize_data._get_county_labels() is visualize_data._county_labels
+
+    # Label points of non-convex counties lie inside the county
+    visualize_data._county_labels = None
+    visualize_data.state_shapefile = gpd.GeoDataFrame(
+        {"COUNTY": ["C"]},
+        geometry=[
+            Polygon([(0, 0), (3, 0), (3, 3), (2, 3), (2, 1), (1, 1), (1, 3), (0, 3)])
+        ],
+        crs="EPSG:4269",
+    )
+    _, lats, lons = visualize_data._get_county_labels()
+    assert visualize_data.state_shapefile.geometry[0].contains(Point(lons[0], lats[0]))
+    assert visualize_data._get_county_labels() is visualize_data._county_labels
+
+    visualize_data._county_labels = None
+    visualize_data.state_shapefile = visualize_data.state_shapefile.rename(
+        columns={"COUNTY": "Unknown"}
+    )
+    with pytest.raises(AttributeError):
+        visualize_data._get_county_labels()
+
+
+def test_get_shapefile_geojson():
+    """
+    Test that county borders are simplified before being serialized, and that the
+    GeoJSON string is cached for each tolerance.
+    """
+    # pylint: disable=protected-access
+    visualize_data = VisualizeData(MagicMock(), "", "", "")
+    # Square with many collinear vertices along its bottom edge
+    border = [(i / 100, 0.0) for i in range(101)] + [(1.0, 1.0), (0.0, 1.0)]
+    visualize_data.state_shapefile = gpd.GeoDataFrame(
+        {"NAME": ["A"]}, geometry=[Polygon(border)], crs="EPSG:4269"
+    )
+
+    geojson = visualize_data._get_shapefile_geojson(0.001)
+    coords = json.loads(geojson)["features"][0]["geometry"]["coordinates"][0]
+    assert len(coords) == 5
+    assert visualize_data._get_shapefile_geojson(0.001) is geojson
+
+    geojson = visualize_data._get_shapefile_geojson(0)
+    coords = json.loads(geojson)["features"][0]["geometry"]["coordinates"][0]
+    assert len(coords) == 104
+
+    map_obj = visualize_data._create_map_with_legend()
+    assert any(
+        isinstance(child, folium.GeoJson) for child in map_obj._children.values()
+    )
+    # County labels are added to the map as one group
+    groups = [
+        child
+        for child in map_obj._children.values()
+        if isinstance(child, folium.FeatureGroup)
+    ]
+    assert len(groups) == 1
+    labels = [
+        icon.options["html"]
+        for marker in groups[0]._children.values()
+        if isinstance(marker, folium.Marker)
+        for icon in marker._children.values()
+        if isinstance(icon, folium.DivIcon)
+    ]
+    assert labels == [VisualizeData._COUNTY_LABEL_HTML.format(name="A")]
+
+
+def test_map_center_from_state_bounds():
+    """
+    Test that the map is centered on the bounding box of the state shapefile.
+    """
+    # pylint: disable=protected-access
+    visualize_data = VisualizeData(MagicMock(), "", "", "")
+    visualize_data.state_shapefile = gpd.GeoDataFrame(
+        {"NAME": ["A", "B"]},
+        geometry=[box(-80.0, 40.0, -79.0, 41.0), box(-79.0, 40.0, -78.0, 42.0)],
+        crs="EPSG:4269",
+    )
+
+    map_obj = visualize_data._create_map_with_legend(shapefile=False)
+    assert map_obj.location == [41.0, -79.0]
+    assert map_obj.options["prefer_canvas"]
+    assert visualize_data._map_center == (41.0, -79.0)
+
 
 def test_create_map_with_legend():
     """
@@ -127,6 +296,12 @@ def test_create_map_with_legend():
         assert "o - Gas Well" in rendered_html
         assert "x - Oil Well" in rendered_html
 
+        # Legend and title are added as a single element
+        assert len(map_obj.get_root().html._children) == 1
+
+        map_obj = visualize_data._create_map_with_legend(shapefile=False)
+        assert not map_obj.get_root().html._children
+
 
 def test_add_well_markers():
     """
@@ -151,6 +326,77 @@ def test_add_well_markers():
     assert len(map_obj._children) > 0  # Check if markers are added to the map
 
 
+@pytest.mark.parametrize("well_type", ["Gas", "Oil", None])
+def test_add_well_markers_single_layer(well_type):
+    """
+    Test that _add_well_markers adds all wells to the map as a single GeoJson layer.
+    """
+    # pylint: disable=protected-access
+    well_data = MagicMock()
+    well_data.col_names.well_id = "Well ID"
+    well_data.col_names.age = "Age"
+    well_data.col_names.depth = "Depth"
+    gdf = gpd.GeoDataFrame(
+        {"Well ID": ["A", "B"], "Age": [10, 20], "Depth": [100, 200]},
+        geometry=[Point(-80.0, 40.0), Point(-79.0, 41.0)],
+        crs="EPSG:4326",
+    )
+    with patch("primo.utils.map_utils.get_data_as_geodataframe", return_value=gdf):
+        visualize_data = VisualizeData(well_data, "", "", "")
+
+    map_obj = folium.Map(location=[0, 0], zoom_start=8)
+    visualize_data._add_well_markers(map_obj, well_type_to_plot=well_type)
+
+    layers = [
+        child
+        for child in map_obj._children.values()
+        if isinstance(child, folium.GeoJson)
+    ]
+    assert len(layers) == 1
+    assert len(layers[0].data["features"]) == 2
+    assert "Well ID: B" in map_obj.get_root().render()
+    assert visualize_data._well_popups[0] == "Well ID: A<br>Age: 10<br>Depth: 100"
+
+    # Large sets of wells can be clustered in the browser instead
+    map_obj = folium.Map(location=[0, 0], zoom_start=8)
+    visualize_data._add_well_markers(map_obj, well_type_to_plot=well_type, cluster=True)
+    clusters = [
+        child
+        for child in map_obj._children.values()
+        if isinstance(child, FastMarkerCluster)
+    ]
+    assert len(clusters) == 1
+    assert clusters[0].data[1] == [41.0, -79.0, "Well ID: B<br>Age: 20<br>Depth: 200"]
+
+
+def test_wells_without_location_are_skipped():
+    """
+    Test that wells with missing, empty or non-finite geometries are dropped
+    before markers are built.
+    """
+    # pylint: disable=protected-access
+    well_data = MagicMock()
+    well_data.col_names.well_id = "Well ID"
+    well_data.col_names.age = "Age"
+    well_data.col_names.depth = "Depth"
+    gdf = gpd.GeoDataFrame(
+        {
+            "Well ID": ["A", "B", "C", "D"],
+            "Age": [10, 20, 30, 40],
+            "Depth": [100, 200, 300, 400],
+        },
+        geometry=[Point(-80.0, 40.0), Point(), None, Point(float("nan"), 41.0)],
+        crs="EPSG:4326",
+    )
+    with patch("primo.utils.map_utils.get_data_as_geodataframe", return_value=gdf):
+        visualize_data = VisualizeData(well_data, "", "", "")
+
+    assert list(visualize_data._well_ids) == ["A"]
+    assert list(visualize_data._ages) == [10]
+    assert list(visualize_data._lats) == [40.0]
+    assert list(visualize_data._lons) == [-80.0]
+
+
 def test_add_campaign_markers():
     """
     Test the _add_campaign_markers method to verify it adds markers for wells belonging to
@@ -172,13 +418,51 @@ def test_add_campaign_markers():
     ]
 
     campaign = MagicMock()
-    campaign.get_project_id_by_well_id.return_value = 1
+    campaign.well_to_project = {"A": 1}
 
     visualize_data._add_campaign_markers(map_obj, campaign)
 
     assert len(map_obj._children) > 0  # Check if markers are added to the map
 
 
+def test_add_campaign_markers_colors():
+    """
+    Test that _add_campaign_markers colors wells by project and skips wells that
+    do not belong to any project.
+    """
+    # pylint: disable=protected-access
+    well_data = MagicMock()
+    well_data.col_names.well_id = "Well ID"
+    well_data.col_names.age = "Age"
+    well_data.col_names.depth = "Depth"
+    gdf = gpd.GeoDataFrame(
+        {"Well ID": ["A", "B", "C", "D"], "Age": [1] * 4, "Depth": [1] * 4},
+        geometry=[Point(-80.0, 40.0), Point(-79.0, 41.0)] * 2,
+        crs="EPSG:4326",
+    )
+    with patch("primo.utils.map_utils.get_data_as_geodataframe", return_value=gdf):
+        visualize_data = VisualizeData(well_data, "", "", "")
+    campaign = MagicMock()
+    campaign.well_to_project = {"A": 3, "B": 1, "D": 3}
+
+    map_obj = folium.Map(location=[0, 0], zoom_start=8)
+    visualize_data._add_campaign_markers(map_obj, campaign)
+
+    layer = next(
+        child
+        for child in map_obj._children.values()
+        if isinstance(child, folium.GeoJson)
+    )
+    assert [
+        (feature["properties"]["popup"], feature["properties"]["color"])
+        for feature in layer.data["features"]
+    ] == [
+        ("Candidate Project: Project 3", "blue"),
+        ("Candidate Project: Project 1", "red"),
+        ("Candidate Project: Project 3", "blue"),
+    ]
+
+
 def test_visualize_wells():
     """
     Test the visualize_wells method to verify it generates a folium map with well markers
@@ -0,0 +1,48 @@
+#################################################################################
+# PRIMO - The P&A Project Optimizer was produced under the Methane Emissions
+# Reduction Program (MERP) and National Energy Technology Laboratory's (NETL)
+# National Emissions Reduction Initiative (NEMRI).
+#
+# NOTICE. This Software was developed under funding from the U.S. Government
+# and the U.S. Government consequently retains certain rights. As such, the
+# U.S. Government has been granted for itself and others acting on its behalf
+# a paid-up, nonexclusive, irrevocable, worldwide license in the Software to
+# reproduce, distribute copies to the public, prepare derivative works, and
+# perform publicly and display publicly, and to permit others to do so.
+#################################################################################
+
+# Installed libs
+import nbformat
+import pytest
+
+# User-defined libs
+from primo.utils.multiple_scenario_util import _inject_parameters
+
+
+@pytest.mark.parametrize("reset", [False, True])
+def test_inject_parameters(reset):
+    nb = nbformat.v4.new_notebook()
+    nb.cells = [
+        nbformat.v4.new_markdown_cell("Reads config.json"),
+        nbformat.v4.new_code_cell('config = read("config.json")'),
+        nbformat.v4.new_code_cell('write("Primo_projects.xlsx")\nprint("config.json")'),
+    ]
+
+    _inject_parameters(nb, "scenario.json", "Primo_projects_scenario.xlsx", reset)
+
+    assert len(nb.cells) == 4
+    params_cell = nb.cells[0]
+    assert params_cell.cell_type == "code"
+    assert params_cell.metadata["tags"] == ["injected-parameters"]
+    assert params_cell.source == (
+        ("%reset -f\n" if reset else "")
+        + "config_file = 'scenario.json'\n"
+        + "output_xlsx = 'Primo_projects_scenario.xlsx'"
+    )
+
+    # Every code cell is patched, and markdown cells are left as is
+    assert nb.cells[1].source == "Reads config.json"
+    assert nb.cells[2].source == 'config = read("scenario.json")'
+    assert nb.cells[3].source == (
+        'write("Primo_projects_scenario.xlsx")\nprint("scenario.json")'
+    )
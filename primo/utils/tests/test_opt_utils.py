@@ -11,12 +11,16 @@
 # perform publicly and display publicly, and to permit others to do so.
 #################################################################################
 
+# Standard libs
+from types import SimpleNamespace
+
 # Installed libs
 import pyomo.environ as pyo
 import pytest
 
 # User-defined libs
 from primo.utils.opt_utils import (
+    budget_slack_variable_scaling,
     in_bounds,
     is_binary_value,
     is_integer_value,
@@ -82,3 +86,41 @@ def test_is_pyomo_model_feasible(create_test_model):
     solver.solve(create_test_model)
 
     assert is_pyomo_model_feasible(create_test_model, 1e-5)
+
+
+def test_is_pyomo_model_feasible_without_solver(create_test_model):
+    model = create_test_model
+    model.x.value = 4.0
+    model.y.value = 1.0
+    model.z.value = 3.0
+    assert is_pyomo_model_feasible(model, 1e-5)
+
+    # Variables in sub-blocks are checked as well
+    model.b = pyo.Block()
+    model.b.w = pyo.Var(within=pyo.Binary)
+    model.b.w.value = 0.5
+    assert not is_pyomo_model_feasible(model, 1e-5)
+    model.b.w.value = 0.0
+
+    model.z.value = 2.5
+    assert not is_pyomo_model_feasible(model, 1e-5)
+    model.z.value = 3.0
+
+    model.x.value = 9.5
+    assert not is_pyomo_model_feasible(model, 1e-5)
+
+
+@pytest.mark.parametrize(
+    "budget,expected",
+    [(400, (0.575, False)), (1000, (0.46, True))],
+)
+def test_budget_slack_variable_scaling(budget, expected):
+    model_inputs = SimpleNamespace(
+        mobilization_cost={1: 100, 2: 180, 3: 240}, budget=budget
+    )
+    objective_weights = {f"W{i}": 10 + 4 * i for i in range(10)}
+    scaling, budget_sufficient = budget_slack_variable_scaling(
+        model_inputs, objective_weights
+    )
+    assert scaling == pytest.approx(expected[0])
+    assert budget_sufficient == expected[1]
@@ -11,6 +11,10 @@
 # perform publicly and display publicly, and to permit others to do so.
 #################################################################################
 
+# Standard libs
+from itertools import combinations
+from unittest.mock import patch
+
 # Installed libs
 import numpy as np
 import pandas as pd
@@ -24,6 +28,7 @@ from primo.opt_model.result_parser import Campaign
 from primo.opt_model.tests.test_model_options import (  # pylint: disable=unused-import
     get_column_names_fixture,
 )
+from primo.utils.clustering_utils import distance_matrix
 from primo.utils.config_utils import (
     OverrideAddInfo,
     OverrideRemoveLockInfo,
@@ -206,6 +211,39 @@ def or_feasible_selection_fixture():
     return or_selection
 
 
+def test_assess_distances_pairs(or_infeasible_selection, get_model):
+    """
+    Test that assess_distances reports every pair of wells in a project that are
+    farther apart than the threshold distance, in the order of
+    itertools.combinations
+    """
+    opt_campaign, opt_mdl_inputs, eff_metrics = get_model
+    feasibility = OverrideCampaign(
+        or_infeasible_selection,
+        opt_mdl_inputs,
+        opt_campaign.clusters_dict,
+        eff_metrics,
+    ).feasibility
+
+    distances = distance_matrix(feasibility.wd, {"distance": 1})
+    well_ids = feasibility.wd.data[feasibility.wd.column_names.well_id]
+    expected = [
+        (cluster, well_ids[w1], well_ids[w2], distances.loc[w1, w2])
+        for cluster, well_list in feasibility.new_campaign.items()
+        for w1, w2 in combinations(well_list, 2)
+        if distances.loc[w1, w2] > opt_mdl_inputs.config.threshold_distance
+    ]
+    distance_violation = feasibility.assess_distances()
+    assert expected
+    assert list(zip(*distance_violation.values())) == expected
+
+    # The distance matrix is built once and reused
+    with patch("primo.utils.override_utils.distance_matrix") as mock_distance_matrix:
+        assert feasibility.assess_distances() == distance_violation
+        assert not feasibility.assess_feasibility()
+    mock_distance_matrix.assert_not_called()
+
+
 def test_feasible_override_campaign(or_feasible_selection, get_model):
     """
     Test the override campaign class when the new project is feasible
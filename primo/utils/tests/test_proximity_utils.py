@@ -12,10 +12,12 @@
 #################################################################################
 
 # Installed libs
+import numpy as np
 import pandas as pd
 import pytest
 
 # User-defined libs
+from primo.utils import proximity_utils
 from primo.utils.proximity_utils import nearby_hospital_count, nearby_total_school_count
 
 # Sample data for testing
@@ -67,6 +69,58 @@ def test_nearby_hospital_count(well_data, hospital_data, distance):
     assert all(result_df["Hospitals Within Distance"] == [1, 1, 1])
 
 
+def test_nearby_count_uses_row_positions():
+    # Wells are matched by row position, not by index label
+    well_df = pd.DataFrame(WELL_DATA, index=[10, 20, 30])
+    hospital_df = pd.DataFrame(HOSPITAL_DATA[:2])
+    result_df = nearby_hospital_count(well_df, hospital_df, distance_miles=1)
+    assert list(result_df.index) == [10, 20, 30]
+    assert list(result_df["Hospitals Within Distance"]) == [1, 1, 0]
+
+
+def test_nearby_count_drops_wells_without_location():
+    well_df = pd.DataFrame(
+        WELL_DATA + [{"Well_Latitude": 0.0, "Well_Longitude": -73.0}]
+    )
+    school_df = pd.DataFrame(SCHOOL_DATA)
+    result_df = nearby_total_school_count(well_df, school_df, distance_miles=1)
+    assert list(result_df.index) == [0, 1, 2]
+    assert list(result_df["Schools Within Distance"]) == [1, 1, 1]
+    assert result_df["Well_Latitude"].dtype == float
+
+    # The input DataFrames are left unchanged
+    assert well_df.equals(
+        pd.DataFrame(WELL_DATA + [{"Well_Latitude": 0.0, "Well_Longitude": -73.0}])
+    )
+    assert school_df.equals(pd.DataFrame(SCHOOL_DATA))
+
+
+def test_nearby_count_ball_tree(monkeypatch):
+    # Counts agree whether pairs are checked directly or through a BallTree
+    rng = np.random.default_rng(0)
+    well_df = pd.DataFrame(
+        {
+            "Well_Latitude": rng.uniform(40, 40.1, 200),
+            "Well_Longitude": rng.uniform(-80.1, -80, 200),
+        }
+    )
+    hospital_df = pd.DataFrame(
+        {
+            "Hospital_Latitude": rng.uniform(40, 40.1, 50),
+            "Hospital_Longitude": rng.uniform(-80.1, -80, 50),
+        }
+    )
+    direct = nearby_hospital_count(well_df, hospital_df, distance_miles=1)
+    monkeypatch.setattr(proximity_utils, "_BRUTE_FORCE_MAX_PAIRS", 0)
+    ball_tree = nearby_hospital_count(well_df, hospital_df, distance_miles=1)
+    assert direct["Hospitals Within Distance"].sum() > 0
+    assert direct.equals(ball_tree)
+
+    # The tree is built on whichever set is smaller
+    ball_tree = nearby_hospital_count(well_df.head(20), hospital_df, distance_miles=1)
+    assert ball_tree.equals(direct.head(20))
+
+
 # Run tests
 if __name__ == "__main__":
     pytest.main()
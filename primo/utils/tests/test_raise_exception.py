@@ -0,0 +1,34 @@
+#################################################################################
+# PRIMO - The P&A Project Optimizer was produced under the Methane Emissions
+# Reduction Program (MERP) and National Energy Technology Laboratory's (NETL)
+# National Emissions Reduction Initiative (NEMRI).
+#
+# NOTICE. This Software was developed under funding from the U.S. Government
+# and the U.S. Government consequently retains certain rights. As such, the
+# U.S. Government has been granted for itself and others acting on its behalf
+# a paid-up, nonexclusive, irrevocable, worldwide license in the Software to
+# reproduce, distribute copies to the public, prepare derivative works, and
+# perform publicly and display publicly, and to permit others to do so.
+#################################################################################
+
+# Standard libs
+import logging
+
+# Installed libs
+import pytest
+
+# User-defined libs
+from primo.utils.raise_exception import raise_exception
+
+
+def test_raise_exception(caplog):
+    """Checks that the message is logged before the exception is raised"""
+    with caplog.at_level(logging.ERROR), pytest.raises(ValueError, match="Bad value"):
+        raise_exception("Bad value", ValueError)
+
+    record = caplog.records[-1]
+    assert record.levelno == logging.ERROR
+    assert record.getMessage() == "Bad value"
+    # The stack of the caller is logged
+    assert record.funcName == "test_raise_exception"
+    assert "test_raise_exception" in record.stack_info
@@ -19,7 +19,17 @@ from primo.utils.solvers import get_solver
 
 
 @pytest.mark.parametrize(
-    "solver", ["highs", "scip", "glpk", "gurobi", "gurobi_persistent", "unknown_solver"]
+    "solver",
+    [
+        "highs",
+        "appsi_highs",
+        "scip",
+        "glpk",
+        "gurobi",
+        "gurobi_persistent",
+        "unknown_solver",
+        "high",
+    ],
 )
 @pytest.mark.parametrize("stream_output", [True, False])
 @pytest.mark.parametrize("mip_gap", [0.01, 0.1, 1])
@@ -29,7 +39,7 @@ def test_get_solver(solver, stream_output, mip_gap, time_limit, solver_options):
     """
     Test the get solver method
     """
-    if solver == "unknown_solver":
+    if solver in ("unknown_solver", "high"):
         with pytest.raises(ValueError):
             get_solver(
                 solver,